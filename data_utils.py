@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+import functools
+import json
 import operator
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+try:  # optional: Arrow string kernels for contains/startswith/endswith
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = pc = None
+
+try:  # optional: backend="polars"
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+try:  # optional: backend="numba"
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+try:  # optional: backend="numexpr"
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
 
 # -----------------------------
 # Supported operators
@@ -18,13 +42,45 @@ _OPS = {
     "<=": operator.le,
 }
 
-_STRING_OPS = {"contains", "not_contains", "startswith", "endswith"}
-_NULL_OPS = {"isnull", "is_null", "notnull", "not_null"}
-_SET_OPS = {"in", "isin", "not_in", "notin"}
-_RANGE_OPS = {"between"}
+
+# Rough relative per-row cost of each leaf family; AND/OR children are evaluated cheapest-first.
+_LEAF_COST = {"null": 1.0, "compare": 2.0, "range": 3.0, "set": 4.0, "string": 10.0}
 
 
 FilterNode = Dict[str, Any]  # group node or leaf node
+# (ctx, rows) -> boolean ndarray mask over `rows` (row positions), or over all rows when rows is None
+CompiledFilter = Callable[["_FrameContext", Optional[np.ndarray]], np.ndarray]
+
+_COMPILE_CACHE_SIZE = 256
+
+# Below this many rows the pandas -> polars conversion costs more than it saves.
+_POLARS_MIN_ROWS = 10_000
+# Below this many rows a parallel numba kernel launch does not pay for itself.
+_NUMBA_MIN_ROWS = 100_000
+# in/not_in lists up to this size are unrolled into fused kernels; longer ones are not fused.
+_FUSE_MAX_SET = 8
+# Below this many rows numexpr's thread/block setup costs more than the intermediates it saves.
+_NUMEXPR_MIN_ROWS = 100_000
+
+
+def _numexpr_pays_off(n_rows: int) -> bool:
+    # Single-threaded, numexpr's blocked evaluation loses to NumPy's own loops whatever the size.
+    return n_rows >= _NUMEXPR_MIN_ROWS and numexpr.nthreads > 1
+
+
+class _Compiled(NamedTuple):
+    run: CompiledFilter
+    cost: float
+    string_cols: Tuple[Any, ...]  # columns read as strings (one entry per leaf)
+    code_cols: Tuple[Any, ...]  # columns tested by ==/!=/in/not_in (one entry per leaf)
+    columns: Tuple[Any, ...]  # every column a leaf reads (one entry per leaf)
+
+
+class _Program(NamedTuple):
+    run: CompiledFilter
+    shared_strings: frozenset  # columns read as strings by more than one leaf
+    shared_codes: frozenset  # columns tested for equality/membership by more than one leaf
+    columns: Tuple[Any, ...]  # referenced columns, deduplicated in first-seen order
 
 
 def filter_df_nested(
@@ -32,6 +88,8 @@ def filter_df_nested(
     filters: Optional[FilterNode] = None,
     *,
     case_insensitive: bool = False,
+    backend: str = "numpy",
+    sorted_cols: Optional[Iterable[Any]] = None,
 ) -> pd.DataFrame:
     """
     Filters DataFrame using a nested boolean tree.
@@ -44,20 +102,439 @@ def filter_df_nested(
       - Leaf rule:
           {"col": "colname", "op": ">=", "value": 10}
 
-    Returns original df if filters is None/empty.
+    The tree is compiled once into a mask function and cached, so repeated calls
+    with the same filter (on any DataFrame) skip re-parsing the tree.
+
+    backend:
+      - "numpy":  compiled NumPy/pandas evaluation (default)
+      - "polars": translate the tree to a polars expression and evaluate it lazily;
+                  frames smaller than _POLARS_MIN_ROWS use "numpy" instead
+      - "numba":  fuse an all-numeric tree into one parallel JIT kernel (single pass,
+                  no intermediate masks); other trees and small frames use "numpy"
+      - "numexpr": evaluate an all-numeric tree as one numexpr expression (blocked,
+                  multi-threaded, no intermediate masks); otherwise falls back to "numpy"
+      - "query":  translate the tree to a DataFrame.eval string run with engine="numexpr";
+                  trees with string-accessor ops, case-insensitive equality or
+                  extension-dtype columns use "numpy" instead
+      Both numexpr-based backends also use "numpy" for small frames and when numexpr
+      runs single-threaded (numexpr.nthreads == 1), where it is slower than NumPy.
+
+    sorted_cols:
+      Columns the caller guarantees are sorted ascending (NaN last), which is not checked.
+      Numeric range and comparison leaves on them locate their matching block with
+      np.searchsorted instead of scanning; the polars backend marks them with set_sorted.
+
+    Returns original df if filters is None/empty, or if df has no rows (after the
+    tree and its columns have been checked).
     """
+    mask_fn = _MASK_BACKENDS.get(backend)
+    if mask_fn is None:
+        raise ValueError(f"backend must be one of: {', '.join(repr(b) for b in _MASK_BACKENDS)}")
+
     if not filters:
         return df
 
-    mask = _eval_node(df, filters, case_insensitive=case_insensitive)
-    return df[mask]
+    program = _compile(filters, case_insensitive)
+    # The tree itself was validated when compiled; the only per-frame check is that its columns exist.
+    # Leaves (and backends) can then read columns without checking again.
+    for col in program.columns:
+        if col not in df.columns:
+            raise KeyError(f"Column not found: {col}")
+    if len(df.index) == 0:
+        return df
+    mask = mask_fn(df, filters, program, case_insensitive, frozenset(sorted_cols or ()))
+    # Integer gather instead of boolean indexing (skips the bool-indexer validation path).
+    return df.take(np.flatnonzero(mask))
+
+
+# -----------------------------
+# Backends
+# -----------------------------
+# Each backend returns a bool ndarray over all rows of df; `program` is the
+# compiled (and therefore validated) tree.
+def _numpy_mask(
+    df: pd.DataFrame, filters: FilterNode, program: _Program, case_insensitive: bool, sorted_cols: frozenset
+) -> np.ndarray:
+    return program.run(_FrameContext(df, program.shared_strings, program.shared_codes, sorted_cols), None)
+
+
+def _polars_mask(
+    df: pd.DataFrame, filters: FilterNode, program: _Program, case_insensitive: bool, sorted_cols: frozenset
+) -> np.ndarray:
+    if pl is None:
+        raise ImportError("backend='polars' requires the 'polars' package.")
+    if len(df) < _POLARS_MIN_ROWS:
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+
+    try:
+        expr = _to_polars_expr(df, filters, case_insensitive)
+        if expr is None:
+            return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+        # Only the referenced columns cross over; the result is a mask applied to the original
+        # pandas frame, so index and dtypes come back untouched.
+        frame = pl.from_pandas(df[list(program.columns)])
+        hinted = [c for c in program.columns if c in sorted_cols]
+        if hinted:
+            frame = frame.with_columns(pl.col(c).set_sorted() for c in hinted)
+        mask = frame.lazy().select(expr.alias("mask")).collect().to_series().to_numpy()
+    except (pl.exceptions.PolarsError, TypeError, ValueError):
+        # A column with no Arrow type (mixed-type objects), or a value polars cannot compare
+        # against the column: the numpy path handles both.
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+    if len(mask) != len(df):  # tree reduced to a bare literal
+        mask = np.full(len(df), bool(mask[0]))
+    return np.asarray(mask, dtype=bool)
+
+
+def _polars_value(s: pd.Series, val: Any) -> Any:
+    # pandas parses date strings against datetime columns; polars needs a real datetime.
+    if isinstance(val, str) and pd.api.types.is_datetime64_any_dtype(s):
+        return pd.Timestamp(val).to_pydatetime()
+    return val
+
+
+def _polars_set_values(s: pd.Series, spec: _SetValues) -> Any:
+    """in/not_in values as one polars list, cast to the column's type where the numpy path would."""
+    dtype = s.dtype if isinstance(s.dtype, np.dtype) else getattr(s.dtype, "numpy_dtype", None)
+    if spec.numeric is not None and isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return pl.Series(_column_values(spec.numeric, dtype)).implode()
+    return pl.Series(spec.values).implode()
+
+
+def _na_is_unknown(s: pd.Series) -> bool:
+    # Nullable dtypes compare missing values to NA; numpy-backed ones give a plain False/True.
+    return isinstance(s.dtype, pd.api.extensions.ExtensionDtype) and s.dtype.na_value is pd.NA
+
+
+def _to_polars_expr(df: pd.DataFrame, node: Any, case_insensitive: bool, negate: bool = False) -> Optional[Any]:
+    """
+    Mirror of _compile_node producing a polars boolean expression (nulls already mapped to False),
+    with NOT pushed down to the leaves the same way; None if a leaf has no exact polars equivalent.
+    """
+    kind, payload = _parse_node(node, case_insensitive)
+    if kind == "not":
+        negate = not negate
+        kind = "and"
+    if kind != "leaf":
+        if negate:
+            kind = "or" if kind == "and" else "and"
+        exprs = []
+        for child in payload:
+            expr = _to_polars_expr(df, child, case_insensitive, negate)
+            if expr is None:
+                return None
+            exprs.append(expr)
+        return functools.reduce(operator.or_ if kind == "or" else operator.and_, exprs)
+
+    leaf: _Leaf = payload
+    s = df[leaf.col]
+    c = pl.col(leaf.col)
+    family, op_norm, val = leaf.handler.family, leaf.op_norm, leaf.value
+    # Whether a null result is NA (kept null until negated, then dropped) or a definite answer.
+    unknown = False
+
+    if family == "null":
+        hit = c.is_null() if op_norm in ("isnull", "is_null") else c.is_not_null()
+    elif family == "set":
+        if val.has_missing:
+            return None  # which missing values pandas' isin matches depends on the dtype
+        hit = c.is_in(_polars_set_values(s, val)).fill_null(False)
+        if op_norm in ("not_in", "notin"):
+            hit = ~hit
+    elif family == "range":
+        low, high = (_polars_value(s, v) for v in val)
+        hit = c.is_between(low, high, closed="both")
+        unknown = _na_is_unknown(s)
+        if not unknown:
+            hit = hit.fill_null(False)
+    elif family == "string":
+        if not pd.api.types.is_string_dtype(s.dtype):
+            return None  # polars renders datetimes/floats as text differently from pandas
+        text = c.cast(pl.String)
+        if case_insensitive:
+            text = text.str.to_lowercase()
+        if op_norm in ("contains", "not_contains"):
+            hit = text.str.contains(val, literal=True).fill_null(False)
+            if op_norm == "not_contains":
+                hit = ~hit
+        elif op_norm == "startswith":
+            hit = text.str.starts_with(val).fill_null(False)
+        else:
+            hit = text.str.ends_with(val).fill_null(False)
+    else:
+        # Basic comparisons. pandas: a missing value (NaN/None/NaT in polars' null) is never ==,
+        # always !=, and never ordered -- except on nullable dtypes and the lowercased "string"
+        # view of case-insensitive equality, where the result is NA.
+        cmp = _OPS[op_norm]
+        lowered = case_insensitive and op_norm in ("==", "!=") and pd.api.types.is_object_dtype(s)
+        unknown = lowered or _na_is_unknown(s)
+        if lowered:
+            hit = (
+                cmp(c.cast(pl.String).str.to_lowercase(), str(val).lower())
+                if val is not None
+                else pl.lit(None, dtype=pl.Boolean)
+            )
+        elif val is None:
+            # nothing equals None, everything is != None (NA for missing values on nullable dtypes)
+            hit = pl.when(c.is_not_null() | (not unknown)).then(op_norm == "!=")
+        else:
+            hit = cmp(c, _polars_value(s, val))
+        if not unknown:
+            hit = hit.fill_null(op_norm == "!=")
+
+    if negate:
+        hit = ~hit
+    return hit.fill_null(False) if unknown else hit
+
+
+# -----------------------------
+# Per-call evaluation state
+# -----------------------------
+class _FrameContext:
+    """The frame being filtered plus column-level caches that live for one call."""
+
+    __slots__ = (
+        "df", "shared_strings", "shared_codes", "sorted_cols", "_series", "_arrays", "_lower", "_arrow", "_codes"
+    )
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        shared_strings: frozenset = frozenset(),
+        shared_codes: frozenset = frozenset(),
+        sorted_cols: frozenset = frozenset(),
+    ):
+        self.df = df
+        self.shared_strings = shared_strings
+        self.shared_codes = shared_codes
+        self.sorted_cols = sorted_cols
+        self._series: Dict[Any, pd.Series] = {}
+        self._arrays: Dict[Any, np.ndarray] = {}
+        self._lower: Dict[Any, pd.Series] = {}
+        self._arrow: Dict[Any, Any] = {}
+        self._codes: Dict[Any, Tuple[np.ndarray, pd.Index]] = {}
+
+    def series(self, col: Any, rows: Optional[np.ndarray]) -> pd.Series:
+        s = self._series.get(col)
+        if s is None:
+            s = self._series[col] = self.df[col]
+        return s if rows is None else s.iloc[rows]
+
+    def array(self, col: Any, rows: Optional[np.ndarray]) -> np.ndarray:
+        """`col` as a NumPy array (no copy), fetched once per call; fast paths index it directly."""
+        arr = self._arrays.get(col)
+        if arr is None:
+            arr = self._arrays[col] = self.series(col, None).to_numpy(copy=False)
+        return arr if rows is None else arr[rows]
+
+    def lowered(self, col: Any, rows: Optional[np.ndarray]) -> pd.Series:
+        """Lowercased string view of `col`, computed once per call if several leaves need it."""
+        if col not in self.shared_strings:
+            return _as_str(self.series(col, rows), True)
+        low = self._lower.get(col)
+        if low is None:
+            low = self._lower[col] = _as_str(self.series(col, None), True)
+        return low if rows is None else low.iloc[rows]
+
+    def arrow_strings(self, col: Any, rows: Optional[np.ndarray]) -> Any:
+        """`col` as an Arrow string array, or None if it is not plain strings (or pyarrow is missing)."""
+        if pa is None:
+            return None
+        if col not in self.shared_strings:
+            return _to_arrow_strings(self.series(col, rows))
+        if col not in self._arrow:
+            self._arrow[col] = _to_arrow_strings(self.series(col, None))
+        arr = self._arrow[col]
+        return arr if arr is None or rows is None else arr.take(rows)
+
+    def codes(self, col: Any, rows: Optional[np.ndarray]) -> Optional[Tuple[np.ndarray, pd.Index]]:
+        """
+        (codes, uniques) for a categorical or object `col`, else None. Categoricals use
+        their own codes; object columns are factorized once per call, and only when
+        several equality/membership leaves share them. Missing values get code -1.
+        """
+        s = self.series(col, None)
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            codes, uniques = s.cat.codes.to_numpy(), s.cat.categories
+        elif col in self.shared_codes and pd.api.types.is_object_dtype(s):
+            if col not in self._codes:
+                codes, uniques = pd.factorize(s)
+                self._codes[col] = (_narrow_codes(codes, len(uniques)), uniques)
+            codes, uniques = self._codes[col]
+        else:
+            return None
+        return (codes if rows is None else codes[rows]), uniques
+
+
+# -----------------------------
+# Compilation
+# -----------------------------
+class _TreeKey:
+    """Hashable handle for a filter tree: compares by its canonical JSON, carries the original node."""
+
+    __slots__ = ("key", "node")
+
+    def __init__(self, key: str, node: FilterNode):
+        self.key = key
+        self.node = node
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _TreeKey) and self.key == other.key
+
+
+def _json_default(o: Any) -> Any:
+    # Tag non-JSON values with their type so e.g. "2025-01-01" and date(2025, 1, 1) never share a key.
+    tag = f"{type(o).__module__}.{type(o).__qualname__}"
+    if hasattr(o, "tolist"):
+        return [tag, o.tolist()]
+    if isinstance(o, (set, frozenset)):
+        return [tag, sorted(map(repr, o))]
+    return [tag, repr(o)]
 
 
-def _eval_node(df: pd.DataFrame, node: Any, *, case_insensitive: bool) -> pd.Series:
+def _compile(node: FilterNode, case_insensitive: bool) -> _Program:
+    """Return the compiled program for `node`, reusing a cached one for structurally identical trees."""
+    try:
+        key = json.dumps(node, sort_keys=True, default=_json_default)
+    except (TypeError, ValueError):
+        # Non-string keys / circular trees: compile without caching (and let validation complain).
+        return _build_program(node, case_insensitive)
+    return _compile_cached(_TreeKey(key, node), case_insensitive)
+
+
+@functools.lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def _compile_cached(tree: _TreeKey, case_insensitive: bool) -> _Program:
+    return _build_program(tree.node, case_insensitive)
+
+
+def _build_program(node: FilterNode, case_insensitive: bool) -> _Program:
+    root = _compile_node(node, case_insensitive=case_insensitive)
+    return _Program(
+        root.run, _repeated(root.string_cols), _repeated(root.code_cols), tuple(dict.fromkeys(root.columns))
+    )
+
+
+def _repeated(cols: Iterable[Any]) -> frozenset:
+    seen, shared = set(), set()
+    for col in cols:
+        (shared if col in seen else seen).add(col)
+    return frozenset(shared)
+
+
+# A later AND/OR child only runs on the undecided rows when they are at most this fraction of
+# the rows; past it the row gather and mask scatter cost more than the skipped work saves.
+_GATHER_MAX_FRACTION = 0.25
+
+
+def _combine(children: List[_Compiled], group_key: str) -> _Compiled:
+    """
+    Short-circuiting AND/OR: children run cheapest-first, and each later child only
+    sees the rows still undecided (survivors for AND, non-matches for OR).
+    """
+    cost = sum(c.cost for c in children)
+    string_cols = tuple(col for c in children for col in c.string_cols)
+    code_cols = tuple(col for c in children for col in c.code_cols)
+    columns = tuple(col for c in children for col in c.columns)
+    fns = [c.run for c in sorted(children, key=lambda c: c.cost)]
+    if len(fns) == 1:
+        return _Compiled(fns[0], cost, string_cols, code_cols, columns)
+    is_and = group_key == "and"
+
+    def run(ctx: _FrameContext, rows: Optional[np.ndarray]) -> np.ndarray:
+        # Child masks are always freshly allocated, so the first one doubles as the output buffer.
+        out = fns[0](ctx, rows)
+        for fn in fns[1:]:
+            hits = np.count_nonzero(out)
+            n_undecided = hits if is_and else out.size - hits
+            if n_undecided == 0:
+                break
+            if n_undecided > out.size * _GATHER_MAX_FRACTION:
+                # Barely narrowed: evaluating every row and folding the masks beats the gather/scatter.
+                _fold_into(out, fn(ctx, rows), is_and)
+                continue
+            undecided = np.flatnonzero(out if is_and else ~out)
+            out[undecided] = fn(ctx, undecided if rows is None else rows[undecided])
+        return out
+
+    return _Compiled(run, cost, string_cols, code_cols, columns)
+
+
+# Below this many rows the word-view setup costs more than the narrower loop saves.
+_SWAR_MIN_ROWS = 1 << 16
+
+
+def _fold_into(out: np.ndarray, m: np.ndarray, is_and: bool) -> None:
+    """
+    out &= m (or |= m) in place. NumPy bools are single 0/1 bytes, so the bulk of the
+    buffers can be combined as uint64 words, 8 rows per operation; the tail goes bytewise.
+    """
+    n = out.size - out.size % 8
+    if n >= _SWAR_MIN_ROWS and out.flags.c_contiguous and m.flags.c_contiguous:
+        words = out[:n].view(np.uint64)
+        (np.bitwise_and if is_and else np.bitwise_or)(words, m[:n].view(np.uint64), out=words)
+        out, m = out[n:], m[n:]
+    (np.logical_and if is_and else np.logical_or)(out, m, out=out)
+
+
+def _as_mask(result: Any, negate: bool = False) -> np.ndarray:
+    """
+    Coerce a leaf result to a writable bool ndarray of the rows where it is True, or with
+    `negate` where it is False. Missing (NA) results are neither, so they count as False both ways.
+    """
+    if isinstance(result, (pd.Series, pd.api.extensions.ExtensionArray)):
+        result = (~result if negate else result).to_numpy(dtype=bool, na_value=False)
+    else:
+        result = np.asarray(result, dtype=bool)
+        if negate:
+            return np.logical_not(result)
+    # pandas may hand back read-only views (copy-on-write); combinators write in place.
+    return result if result.flags.writeable else result.copy()
+
+
+def _is_numpy_numeric(s: pd.Series) -> bool:
+    return isinstance(s.dtype, np.dtype) and s.dtype.kind in "biuf"
+
+
+def _is_real_scalar(val: Any) -> bool:
+    return isinstance(val, (int, float, np.number)) and not isinstance(val, np.complexfloating)
+
+
+def _is_missing(val: Any) -> bool:
+    return val is None or val is pd.NA or val is pd.NaT or (isinstance(val, (float, np.floating)) and np.isnan(val))
+
+
+class _Leaf(NamedTuple):
+    col: Any
+    op: Any  # as written, for error messages
+    op_norm: str
+    handler: "_Handler"
+    value: Any  # already prepared by the family's preparer
+
+
+_LEAF_KEYS = frozenset(("col", "op", "value"))
+_GROUP_KEYS = ("and", "or", "not")
+
+
+def _parse_node(node: Any, case_insensitive: bool) -> Tuple[str, Any]:
+    """
+    Validate one node and split it into (kind, payload):
+      ("and" | "or", [children]), ("not", [children]) or ("leaf", _Leaf).
+    A NOT payload is always a list, meaning NOT(AND(children)).
+    """
     if not isinstance(node, dict):
         raise TypeError(f"Each node must be a dict. Got: {type(node)}")
 
-    keys = {k.lower().strip() for k in node.keys()}
+    # Keys are nearly always already lowercase: decide plain leaves and single-key groups from the
+    # dict itself, and only build the normalized key set for anything else.
+    if node.keys() <= _LEAF_KEYS:
+        keys: Iterable[str] = ()
+    elif len(node) == 1 and next(iter(node)) in _GROUP_KEYS:
+        keys = node.keys()
+    else:
+        keys = {k.lower().strip() for k in node.keys()}
 
     # -----------------------------
     # Group nodes
@@ -74,13 +551,7 @@ def _eval_node(df: pd.DataFrame, node: Any, *, case_insensitive: bool) -> pd.Ser
             raise ValueError(f"Group node '{group_key}' must have a list of children.")
         if not isinstance(children, list) or len(children) == 0:
             raise ValueError(f"Group node '{group_key}' must be a non-empty list.")
-
-        child_masks = [_eval_node(df, child, case_insensitive=case_insensitive) for child in children]
-
-        out = child_masks[0]
-        for m in child_masks[1:]:
-            out = out & m if group_key == "and" else out | m
-        return out
+        return group_key, children
 
     if "not" in keys:
         child = node.get("not") if "not" in node else node.get("NOT")
@@ -91,13 +562,8 @@ def _eval_node(df: pd.DataFrame, node: Any, *, case_insensitive: bool) -> pd.Ser
         if isinstance(child, list):
             if len(child) == 0:
                 raise ValueError("NOT with a list must be non-empty.")
-            cm = [_eval_node(df, c, case_insensitive=case_insensitive) for c in child]
-            combined = cm[0]
-            for m in cm[1:]:
-                combined = combined & m
-            return ~combined
-
-        return ~_eval_node(df, child, case_insensitive=case_insensitive)
+            return "not", child
+        return "not", [child]
 
     # -----------------------------
     # Leaf rule node
@@ -110,65 +576,645 @@ def _eval_node(df: pd.DataFrame, node: Any, *, case_insensitive: bool) -> pd.Ser
     if col is None or op is None:
         raise ValueError("Leaf rule must include 'col' and 'op' (and usually 'value').")
 
-    if col not in df.columns:
-        raise KeyError(f"Column not found: {col}")
-
-    s = df[col]
     op_norm = str(op).lower().strip()
+    handler = _HANDLERS.get(op_norm)
+    if handler is None:
+        raise ValueError(f"Unsupported operator: {op}")
 
-    # NULL ops
-    if op_norm in _NULL_OPS:
-        if op_norm in ("isnull", "is_null"):
-            return s.isna()
-        return s.notna()
-
-    # IN / NOT IN
-    if op_norm in _SET_OPS:
-        if val is None:
-            raise ValueError(f"Operator '{op}' requires a list/iterable value for column '{col}'.")
-        vals = list(val) if not isinstance(val, (str, bytes)) else [val]
-        if op_norm in ("in", "isin"):
-            return s.isin(vals)
-        return ~s.isin(vals)
-
-    # BETWEEN (inclusive)
-    if op_norm in _RANGE_OPS:
-        if not (isinstance(val, (list, tuple)) and len(val) == 2):
-            raise ValueError(f"Operator 'between' requires value [low, high] for column '{col}'.")
-        low, high = val
-        return s.between(low, high, inclusive="both")
-
-    # String ops
-    if op_norm in _STRING_OPS:
-        if val is None:
-            raise ValueError(f"Operator '{op}' requires a value for column '{col}'.")
-        s_str = s.astype("string")
-        needle = str(val)
+    prepared = _PREPARERS[handler.family](op, col, val, case_insensitive)
+    return "leaf", _Leaf(col, op, op_norm, handler, prepared)
 
-        if case_insensitive:
-            s_str = s_str.str.lower()
-            needle = needle.lower()
-
-        if op_norm == "contains":
-            return s_str.str.contains(needle, na=False, regex=False)
-        if op_norm == "not_contains":
-            return ~s_str.str.contains(needle, na=False, regex=False)
-        if op_norm == "startswith":
-            return s_str.str.startswith(needle, na=False)
-        # endswith
-        return s_str.str.endswith(needle, na=False)
-
-    # Basic comparisons
-    if op_norm in _OPS:
+
+def _compile_node(node: Any, *, case_insensitive: bool, negate: bool = False) -> _Compiled:
+    """
+    Compile `node` to a mask of the rows where it is True, or with `negate` where it is False.
+    NOT is pushed down to the leaves (De Morgan) instead of inverting a finished mask, so a row
+    whose leaf result is NA (nullable dtypes) stays excluded under NOT, as with pandas' Kleene logic.
+    """
+    kind, payload = _parse_node(node, case_insensitive)
+
+    if kind == "not":  # NOT(AND(children))
+        negate = not negate
+        kind = "and"
+    if kind in ("and", "or"):
+        if negate:
+            kind = "or" if kind == "and" else "and"
+        return _combine(
+            [_compile_node(child, case_insensitive=case_insensitive, negate=negate) for child in payload], kind
+        )
+
+    leaf: _Leaf = payload
+    col, prepared, fn = leaf.col, leaf.value, leaf.handler.fn
+
+    def run_leaf(ctx: _FrameContext, rows: Optional[np.ndarray]) -> np.ndarray:
+        return _as_mask(fn(ctx, col, rows, prepared, case_insensitive), negate)
+
+    family = leaf.handler.family
+    equality = leaf.op_norm in ("==", "!=")
+    reads_strings = family == "string" or (case_insensitive and equality)
+    reads_codes = family == "set" or equality
+    return _Compiled(
+        run_leaf, _LEAF_COST[family], (col,) if reads_strings else (), (col,) if reads_codes else (), (col,)
+    )
+
+
+# -----------------------------
+# Leaf handlers
+# -----------------------------
+# Each handler takes (ctx, col, rows, prepared value, case_insensitive) and returns a mask-like result.
+# Values are validated/normalized once at compile time by the family's preparer.
+def _prepare_passthrough(op: Any, col: Any, val: Any, case_insensitive: bool) -> Any:
+    return val
+
+
+class _SetValues(NamedTuple):
+    values: List[Any]
+    numeric: Optional[np.ndarray]  # values as an array when all are plain non-NaN numbers
+    has_missing: bool
+    bloom: Optional["_Bloom"] = None  # prefilter for long integer lists
+
+
+# Integer in/not_in lists longer than this get a Bloom prefilter at compile time.
+_BLOOM_MIN_VALUES = 1024
+
+_SPLITMIX_C1 = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_C2 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_C3 = np.uint64(0x94D049BB133111EB)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    # Vectorized splitmix64 finalizer; uint64 arithmetic wraps, which is what the mix relies on.
+    z = x.astype(np.uint64)
+    z += _SPLITMIX_C1
+    z ^= z >> np.uint64(30)
+    z *= _SPLITMIX_C2
+    z ^= z >> np.uint64(27)
+    z *= _SPLITMIX_C3
+    z ^= z >> np.uint64(31)
+    return z
+
+
+class _Bloom(NamedTuple):
+    """
+    Two-probe Bloom filter over an integer value list, packed into uint64 words.
+
+    Probes are derived from the low and high halves of one splitmix64 hash. Rows
+    that pass are confirmed exactly with np.isin, so false positives only cost time.
+    """
+
+    bits: np.ndarray
+    mask: np.uint64  # m - 1, with m a power of two
+    span: int  # max - min of the values
+
+    @classmethod
+    def build(cls, values: np.ndarray) -> "_Bloom":
+        m = 1 << max(6, (4 * len(values) - 1).bit_length())
+        bits = np.zeros(m // 64, dtype=np.uint64)
+        mask = np.uint64(m - 1)
+        for pos in cls._positions(_splitmix64(values), mask):
+            np.bitwise_or.at(bits, (pos >> np.uint64(6)).astype(np.intp), np.uint64(1) << (pos & np.uint64(63)))
+        return cls(bits, mask, int(values.max()) - int(values.min()))
+
+    @staticmethod
+    def _positions(h: np.ndarray, mask: np.uint64) -> Tuple[np.ndarray, np.ndarray]:
+        return h & mask, (h >> np.uint64(32)) & mask
+
+    def maybe_contains(self, arr: np.ndarray) -> np.ndarray:
+        out = np.ones(len(arr), dtype=bool)
+        for pos in self._positions(_splitmix64(arr), self.mask):
+            word = self.bits[(pos >> np.uint64(6)).astype(np.intp)]
+            out &= ((word >> (pos & np.uint64(63))) & np.uint64(1)).astype(bool)
+        return out
+
+
+def _prepare_set(op: Any, col: Any, val: Any, case_insensitive: bool) -> _SetValues:
+    if val is None:
+        raise ValueError(f"Operator '{op}' requires a list/iterable value for column '{col}'.")
+    vals = list(val) if not isinstance(val, (str, bytes)) else [val]
+    numeric = None
+    if vals and all(_is_real_scalar(v) and not isinstance(v, (bool, np.bool_)) and v == v for v in vals):
+        numeric = np.asarray(vals)
+    bloom = None
+    if numeric is not None and numeric.dtype.kind in "iu" and len(numeric) > _BLOOM_MIN_VALUES:
+        numeric = np.unique(numeric)
+        bloom = _Bloom.build(numeric)
+    return _SetValues(vals, numeric, any(_is_missing(v) for v in vals), bloom)
+
+
+def _prepare_range(op: Any, col: Any, val: Any, case_insensitive: bool) -> Tuple[Any, Any]:
+    if not (isinstance(val, (list, tuple)) and len(val) == 2):
+        raise ValueError(f"Operator 'between' requires value [low, high] for column '{col}'.")
+    return val[0], val[1]
+
+
+def _prepare_string(op: Any, col: Any, val: Any, case_insensitive: bool) -> str:
+    if val is None:
+        raise ValueError(f"Operator '{op}' requires a value for column '{col}'.")
+    return str(val).lower() if case_insensitive else str(val)
+
+
+def _isnull(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], _val: Any, _ci: bool) -> Any:
+    return ctx.series(col, rows).isna()
+
+
+def _notnull(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], _val: Any, _ci: bool) -> Any:
+    return ctx.series(col, rows).notna()
+
+
+_UNROLL_ISIN_MAX = 4  # up to this many values, chained == beats building np.isin's lookup
+
+
+def _isin(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], spec: _SetValues, _ci: bool) -> Any:
+    dtype = ctx.series(col, None).dtype
+    if spec.numeric is not None and isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+        arr = ctx.array(col, rows)
+        if len(spec.numeric) <= _UNROLL_ISIN_MAX:
+            vals = _column_values(spec.numeric, arr.dtype)
+            out = np.zeros(len(arr), dtype=bool)
+            for v in vals:
+                out |= arr == v
+            return out
+        # np.isin uses a dense lookup table when the value span is small relative to the inputs
+        # (same bound as numpy's own choice); past that it sorts, and the Bloom probe wins.
+        bloom = spec.bloom
+        if bloom is not None and arr.dtype.kind in "iu" and bloom.span > 6 * (len(arr) + len(spec.numeric)):
+            out = bloom.maybe_contains(arr)
+            hits = np.flatnonzero(out)
+            out[hits] = np.isin(arr[hits], spec.numeric)
+            return out
+        return np.isin(arr, spec.numeric)
+
+    # Factorizing folds None/NaN/NaT into code -1, while isin on an object column tells them apart.
+    coded = None if spec.has_missing and pd.api.types.is_object_dtype(dtype) else ctx.codes(col, rows)
+    if coded is not None:
+        # Test the integer codes against the codes of the wanted values.
+        codes, uniques = coded
+        wanted = uniques.get_indexer(spec.values)
+        wanted = wanted[wanted >= 0]
+        if spec.has_missing:
+            wanted = np.append(wanted, -1)
+        return _codes_mask(codes, wanted)
+
+    return ctx.series(col, rows).isin(spec.values)
+
+
+def _column_scalar(val: Any, dtype: np.dtype) -> Any:
+    """
+    `val` as a `dtype` scalar when that is exact, so the compare runs at the column's width
+    (a NumPy-typed value such as np.float64 would otherwise upcast the whole column).
+    """
+    try:
+        cast = dtype.type(val)
+    except (OverflowError, TypeError, ValueError):
+        return val
+    return cast if cast == val else val
+
+
+def _column_values(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """`values` cast to `dtype`, dropping any the column cannot hold exactly (those can never match)."""
+    if values.dtype == dtype:
+        return values
+    with np.errstate(invalid="ignore", over="ignore"):
+        cast = values.astype(dtype)
+    return cast[cast == values]
+
+
+def _narrow_codes(codes: np.ndarray, n_uniques: int) -> np.ndarray:
+    # Smallest signed dtype that still holds -1 and every code; later compares move less memory.
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_uniques <= np.iinfo(dtype).max:
+            return codes.astype(dtype, copy=False)
+    return codes
+
+
+def _codes_mask(codes: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+    if wanted.size == 0:
+        return np.zeros(len(codes), dtype=bool)
+    if wanted.size == 1:
+        return codes == wanted[0]
+    return np.isin(codes, wanted.astype(codes.dtype))
+
+
+def _notin(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], spec: _SetValues, ci: bool) -> Any:
+    return ~_isin(ctx, col, rows, spec, ci)
+
+
+def _sorted_span(
+    arr: np.ndarray, sides: Tuple[Optional[str], Optional[str]], low: Any, high: Any
+) -> Tuple[int, int]:
+    """[start, stop) of the rows of ascending `arr` within the bounds; a None side is unbounded."""
+    # NaN sorts last and never satisfies a comparison, so an open upper end stops at the first NaN.
+    stop_all = int(np.searchsorted(arr, np.nan)) if arr.dtype.kind == "f" else len(arr)
+    # Same narrowing as the scan path, so e.g. 0.1 is looked up as float32(0.1) in a float32 column.
+    low, high = _column_scalar(low, arr.dtype), _column_scalar(high, arr.dtype)
+    start = 0 if sides[0] is None else int(np.searchsorted(arr, low, side=sides[0]))
+    stop = stop_all if sides[1] is None else int(np.searchsorted(arr, high, side=sides[1]))
+    return start, max(start, stop)
+
+
+def _span_mask(start: int, stop: int, n: int, rows: Optional[np.ndarray]) -> np.ndarray:
+    if rows is None:
+        out = np.zeros(n, dtype=bool)
+        out[start:stop] = True
+        return out
+    # `rows` are positions into the full column, so membership in the block is a bounds test.
+    out = rows >= start
+    np.less(rows, stop, out=out, where=out)
+    return out
+
+
+def _is_sorted_fast_path(ctx: _FrameContext, col: Any, *vals: Any) -> bool:
+    return (
+        col in ctx.sorted_cols
+        and _is_numpy_numeric(ctx.series(col, None))
+        and all(_is_real_scalar(v) and v == v for v in vals)
+    )
+
+
+def _between(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], bounds: Tuple[Any, Any], _ci: bool) -> Any:
+    low, high = bounds
+    if _is_sorted_fast_path(ctx, col, low, high):
+        arr = ctx.array(col, None)
+        return _span_mask(*_sorted_span(arr, ("left", "right"), low, high), len(arr), rows)
+    if _is_real_scalar(low) and _is_real_scalar(high) and _is_numpy_numeric(ctx.series(col, None)):
+        arr = ctx.array(col, rows)
+        low, high = _column_scalar(low, arr.dtype), _column_scalar(high, arr.dtype)
+        out = arr >= low
+        # Upper bound only where the lower one held, written into the same buffer.
+        return np.less_equal(arr, high, out=out, where=out)
+    return ctx.series(col, rows).between(low, high, inclusive="both")
+
+
+def _as_str(s: pd.Series, case_insensitive: bool) -> pd.Series:
+    s_str = s.astype("string")
+    return s_str.str.lower() if case_insensitive else s_str
+
+
+def _to_arrow_strings(s: pd.Series) -> Any:
+    try:
+        arr = pa.array(s, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        return None  # mixed object column: let pandas stringify it
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+    return arr
+
+
+def _string_view(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], ci: bool) -> pd.Series:
+    return ctx.lowered(col, rows) if ci else _as_str(ctx.series(col, rows), False)
+
+
+# Plain-Python counterparts of the .str methods, used on object columns.
+_PY_STRING_TESTS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": lambda text, needle: needle in text,
+    "startswith": str.startswith,
+    "endswith": str.endswith,
+}
+
+
+def _object_string_mask(values: np.ndarray, test: Callable[[str, str], bool], needle: str, ci: bool) -> np.ndarray:
+    """Apply `test` over an object array with .astype("string") semantics, without building a StringArray."""
+
+    def hit(v: Any) -> bool:
+        if _is_missing(v):
+            return False
+        text = v if isinstance(v, str) else str(v)
+        return test(text.lower() if ci else text, needle)
+
+    return np.fromiter(map(hit, values), dtype=bool, count=len(values))
+
+
+def _string_handler(arrow_kernel: str, pandas_method: str, *, negate: bool = False) -> Callable[..., Any]:
+    """
+    Build a substring/prefix/suffix handler. Plain string columns go through the
+    pyarrow.compute kernel (ignore_case replaces lowercasing the column); object
+    columns are scanned directly; anything else uses the pandas .str accessor on a
+    "string" view.
+    """
+    kernel = getattr(pc, arrow_kernel) if pc is not None else None
+    py_test = _PY_STRING_TESTS[pandas_method]
+
+    def handler(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], needle: str, ci: bool) -> Any:
+        arr = ctx.arrow_strings(col, rows)
+        if arr is not None:
+            hits = kernel(arr, needle, ignore_case=ci)
+            out = pc.fill_null(hits, False).to_numpy(zero_copy_only=False)
+        elif pd.api.types.is_object_dtype(ctx.df[col]):
+            out = _object_string_mask(ctx.array(col, rows), py_test, needle, ci)
+        else:
+            accessor = _string_view(ctx, col, rows, ci).str
+            if pandas_method == "contains":
+                out = accessor.contains(needle, na=False, regex=False)
+            else:
+                out = getattr(accessor, pandas_method)(needle, na=False)
+        return ~out if negate else out
+
+    return handler
+
+
+# searchsorted sides bounding the rows that satisfy `x <op> val` on an ascending column
+# (!= is the complement of the == block).
+_SORTED_SIDES: Dict[Callable[[Any, Any], Any], Tuple[Optional[str], Optional[str]]] = {
+    operator.ge: ("left", None),
+    operator.gt: ("right", None),
+    operator.le: (None, "right"),
+    operator.lt: (None, "left"),
+    operator.eq: ("left", "right"),
+    operator.ne: ("left", "right"),
+}
+
+
+def _comparison(cmp: Callable[[Any, Any], Any]) -> Callable[..., Any]:
+    equality = cmp in (operator.eq, operator.ne)
+    sides = _SORTED_SIDES[cmp]
+
+    def handler(ctx: _FrameContext, col: Any, rows: Optional[np.ndarray], val: Any, ci: bool) -> Any:
+        if _is_sorted_fast_path(ctx, col, val):
+            arr = ctx.array(col, None)
+            out = _span_mask(*_sorted_span(arr, sides, val, val), len(arr), rows)
+            return np.logical_not(out, out=out) if cmp is operator.ne else out
+        full = ctx.series(col, None)
+        # Plain numpy columns compare directly on the underlying array, skipping pandas dispatch.
+        if _is_real_scalar(val) and _is_numpy_numeric(full):
+            arr = ctx.array(col, rows)
+            return cmp(arr, _column_scalar(val, arr.dtype))
+        coded = None
+        if equality and (val is None or isinstance(val, str) or _is_real_scalar(val)):
+            coded = ctx.codes(col, rows)
+        if coded is not None:
+            # Compare against the (few) uniques once, then test codes; missing rows (-1) never match.
+            codes, uniques = coded
+            if ci and pd.api.types.is_object_dtype(full):
+                # Same NA results as the lowercased "string" view below: compare a missing slot
+                # appended after the uniques, which is where code -1 lands.
+                right = str(val).lower() if val is not None else val
+                table = cmp(_as_str(pd.Series([*uniques, None], dtype=object), True), right).array
+                return table.take(codes.astype(np.intp))
+            out = _codes_mask(codes, np.flatnonzero(_as_mask(uniques == val)))
+            return out if cmp is operator.eq else np.logical_not(out, out=out)
         # Optional: case-insensitive equality/inequality on object-like columns
-        if case_insensitive and op_norm in ("==", "!=") and pd.api.types.is_object_dtype(s):
-            left = s.astype("string").str.lower()
+        if ci and equality and pd.api.types.is_object_dtype(full):
             right = str(val).lower() if val is not None else val
-            return _OPS[op_norm](left, right)
+            return cmp(ctx.lowered(col, rows), right)
+        return cmp(ctx.series(col, rows), val)
 
-        return _OPS[op_norm](s, val)
+    return handler
+
+
+class _Handler(NamedTuple):
+    fn: Callable[[_FrameContext, Any, Optional[np.ndarray], Any, bool], Any]
+    family: str  # key into _PREPARERS / _LEAF_COST
+
+
+_PREPARERS: Dict[str, Callable[[Any, Any, Any, bool], Any]] = {
+    "null": _prepare_passthrough,
+    "compare": _prepare_passthrough,
+    "set": _prepare_set,
+    "range": _prepare_range,
+    "string": _prepare_string,
+}
+
+# Flat normalized-op -> handler table, aliases listed explicitly.
+_HANDLERS: Dict[str, _Handler] = {
+    **{op: _Handler(_comparison(fn), "compare") for op, fn in _OPS.items()},
+    "isnull": _Handler(_isnull, "null"),
+    "is_null": _Handler(_isnull, "null"),
+    "notnull": _Handler(_notnull, "null"),
+    "not_null": _Handler(_notnull, "null"),
+    "in": _Handler(_isin, "set"),
+    "isin": _Handler(_isin, "set"),
+    "not_in": _Handler(_notin, "set"),
+    "notin": _Handler(_notin, "set"),
+    "between": _Handler(_between, "range"),
+    "contains": _Handler(_string_handler("match_substring", "contains"), "string"),
+    "not_contains": _Handler(_string_handler("match_substring", "contains", negate=True), "string"),
+    "startswith": _Handler(_string_handler("starts_with", "startswith"), "string"),
+    "endswith": _Handler(_string_handler("ends_with", "endswith"), "string"),
+}
+
+
+def _numba_mask(
+    df: pd.DataFrame, filters: FilterNode, program: _Program, case_insensitive: bool, sorted_cols: frozenset
+) -> np.ndarray:
+    if numba is None:
+        raise ImportError("backend='numba' requires the 'numba' package.")
+    if len(df) < _NUMBA_MIN_ROWS:
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+
+    arrays: Dict[Any, str] = {}
+    consts: List[Any] = []
+    expr = _fused_numeric_expr(df, filters, case_insensitive, arrays, consts)
+    if expr is None:
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+
+    kernel = _numba_kernel(expr, len(arrays), len(consts))
+    out = np.empty(len(df), dtype=np.bool_)
+    kernel(out, *(np.ascontiguousarray(df[c].to_numpy()) for c in arrays), *consts)
+    return out
+
+
+def _fused_numeric_expr(
+    df: pd.DataFrame, node: Any, case_insensitive: bool, arrays: Dict[Any, str], consts: List[Any]
+) -> Optional[str]:
+    """
+    Scalar expression for row `i` over arrays a0, a1, ... and constants c0, c1, ...,
+    or None if any leaf is not a plain numeric predicate. Fills `arrays` (col -> name)
+    and `consts` as it goes.
+    """
+    kind, payload = _parse_node(node, case_insensitive)
+    if kind != "leaf":
+        parts = []
+        for child in payload:
+            part = _fused_numeric_expr(df, child, case_insensitive, arrays, consts)
+            if part is None:
+                return None
+            parts.append(part)
+        joined = "(" + (" or " if kind == "or" else " and ").join(parts) + ")"
+        return f"(not {joined})" if kind == "not" else joined
 
-    raise ValueError(f"Unsupported operator: {op}")
+    leaf: _Leaf = payload
+    if not _is_numpy_numeric(df[leaf.col]):
+        return None
+
+    def const(v: Any) -> str:
+        consts.append(v)
+        return f"c{len(consts) - 1}"
+
+    a = arrays.setdefault(leaf.col, f"a{len(arrays)}") + "[i]"
+    family, op_norm, val = leaf.handler.family, leaf.op_norm, leaf.value
+
+    if family == "null":
+        is_null = op_norm in ("isnull", "is_null")
+        if df[leaf.col].dtype.kind == "f":
+            return f"np.isnan({a})" if is_null else f"(not np.isnan({a}))"
+        return "False" if is_null else "True"
+    if family == "compare" and _is_real_scalar(val):
+        return f"({a} {op_norm} {const(val)})"
+    if family == "range" and all(_is_real_scalar(v) for v in val):
+        return f"({const(val[0])} <= {a} <= {const(val[1])})"
+    if family == "set" and val.numeric is not None and len(val.numeric) <= _FUSE_MAX_SET:
+        hit = "(" + " or ".join(f"{a} == {const(v)}" for v in val.numeric.tolist()) + ")"
+        return hit if op_norm in ("in", "isin") else f"(not {hit})"
+    return None
+
+
+@functools.lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def _numba_kernel(expr: str, n_arrays: int, n_consts: int) -> Callable[..., None]:
+    """JIT a `for i in prange(n): out[i] = expr` kernel; numba specializes it per dtype signature."""
+    params = ", ".join(["out"] + [f"a{k}" for k in range(n_arrays)] + [f"c{k}" for k in range(n_consts)])
+    src = f"def kernel({params}):\n    for i in prange(out.shape[0]):\n        out[i] = {expr}\n"
+    namespace: Dict[str, Any] = {"np": np, "prange": numba.prange}
+    exec(src, namespace)
+    return numba.njit(parallel=True)(namespace["kernel"])
+
+
+def _numexpr_mask(
+    df: pd.DataFrame, filters: FilterNode, program: _Program, case_insensitive: bool, sorted_cols: frozenset
+) -> np.ndarray:
+    if numexpr is None:
+        raise ImportError("backend='numexpr' requires the 'numexpr' package.")
+    if not _numexpr_pays_off(len(df)):
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+
+    local_dict: Dict[str, Any] = {}
+    arrays: Dict[Any, str] = {}
+    expr = _numexpr_expr(df, filters, case_insensitive, arrays, local_dict)
+    if expr is None:
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+    for col, name in arrays.items():
+        local_dict[name] = df[col].to_numpy()
+
+    try:
+        out = numexpr.evaluate(expr, local_dict=local_dict)
+    except (KeyError, TypeError, ValueError, NotImplementedError):
+        # Dtype/constant combinations numexpr cannot type; the per-leaf path handles them.
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+    return np.broadcast_to(out, len(df)).astype(bool, copy=out.ndim == 0)
+
+
+def _numexpr_expr(
+    df: pd.DataFrame, node: Any, case_insensitive: bool, arrays: Dict[Any, str], local_dict: Dict[str, Any]
+) -> Optional[str]:
+    """
+    numexpr expression over whole columns a0, a1, ... and constants c0, c1, ...,
+    or None if any leaf is not a plain numeric predicate. Constants are passed
+    through `local_dict` rather than inlined so they keep their exact value.
+    """
+    kind, payload = _parse_node(node, case_insensitive)
+    if kind != "leaf":
+        parts = []
+        for child in payload:
+            part = _numexpr_expr(df, child, case_insensitive, arrays, local_dict)
+            if part is None:
+                return None
+            parts.append(part)
+        joined = "(" + (" | " if kind == "or" else " & ").join(parts) + ")"
+        return f"(~{joined})" if kind == "not" else joined
+
+    leaf: _Leaf = payload
+    # numexpr computes uint64 in float64, which is inexact for large values.
+    if not _is_numpy_numeric(df[leaf.col]) or df[leaf.col].dtype == np.uint64:
+        return None
+
+    def const(v: Any) -> str:
+        name = f"c{len(local_dict)}"  # only constants are in local_dict until translation ends
+        local_dict[name] = v
+        return name
+
+    a = arrays.setdefault(leaf.col, f"a{len(arrays)}")
+    family, op_norm, val = leaf.handler.family, leaf.op_norm, leaf.value
+
+    if family == "null":
+        # x != x is true only for NaN, so this also covers integer columns (never null).
+        return f"({a} != {a})" if op_norm in ("isnull", "is_null") else f"({a} == {a})"
+    if family == "compare" and _is_real_scalar(val):
+        return f"({a} {op_norm} {const(val)})"
+    if family == "range" and all(_is_real_scalar(v) for v in val):
+        return f"(({a} >= {const(val[0])}) & ({a} <= {const(val[1])}))"
+    if family == "set" and val.numeric is not None and len(val.numeric) <= _FUSE_MAX_SET:
+        hit = "(" + " | ".join(f"({a} == {const(v)})" for v in val.numeric.tolist()) + ")"
+        return hit if op_norm in ("in", "isin") else f"(~{hit})"
+    return None
+
+
+def _query_mask(
+    df: pd.DataFrame, filters: FilterNode, program: _Program, case_insensitive: bool, sorted_cols: frozenset
+) -> np.ndarray:
+    if numexpr is None:
+        raise ImportError("backend='query' requires the 'numexpr' package.")
+    if not _numexpr_pays_off(len(df)):
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+
+    local_dict: Dict[str, Any] = {}
+    expr = _to_query_str(df, filters, case_insensitive, local_dict)
+    if expr is None:
+        return _numpy_mask(df, filters, program, case_insensitive, sorted_cols)
+    return _as_mask(df.eval(expr, engine="numexpr", local_dict=local_dict))
+
+
+def _to_query_str(df: pd.DataFrame, node: Any, case_insensitive: bool, local_dict: Dict[str, Any]) -> Optional[str]:
+    """
+    DataFrame.eval expression for `node`, e.g. "((`age` >= @c0) & (`state` in @c1))",
+    or None if some leaf has no faithful translation. Values are bound as @c0, @c1, ...
+    through `local_dict`.
+    """
+    kind, payload = _parse_node(node, case_insensitive)
+    if kind != "leaf":
+        parts = []
+        for child in payload:
+            part = _to_query_str(df, child, case_insensitive, local_dict)
+            if part is None:
+                return None
+            parts.append(part)
+        joined = "(" + (" | " if kind == "or" else " & ").join(parts) + ")"
+        return f"(~{joined})" if kind == "not" else joined
+
+    leaf: _Leaf = payload
+    family, op_norm, val = leaf.handler.family, leaf.op_norm, leaf.value
+    dtype = df[leaf.col].dtype
+    # Extension dtypes carry NA, which stays NA through ~ instead of counting as False first;
+    # string-accessor ops and lowered comparisons would make numexpr fall back to Python anyway.
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biufMO":
+        return None
+    if not isinstance(leaf.col, str) or "`" in leaf.col:  # not expressible as a backticked name
+        return None
+    if family == "string" or (case_insensitive and op_norm in ("==", "!=")):
+        return None
+
+    def const(v: Any) -> str:
+        name = f"c{len(local_dict)}"
+        local_dict[name] = v
+        return f"@{name}"
+
+    c = f"`{leaf.col}`"
+    if family == "null":
+        # Only missing values (NaN/NaT/None) compare unequal to themselves.
+        return f"({c} != {c})" if op_norm in ("isnull", "is_null") else f"({c} == {c})"
+    if family in ("compare", "range"):
+        bounds = [val] if family == "compare" else list(val)
+        if not all(_is_real_scalar(v) or isinstance(v, str) for v in bounds):
+            return None
+        if dtype.kind == "M" and any(isinstance(v, str) for v in bounds):
+            # eval compares datetime64 against a str as never equal; pandas parses the string.
+            try:
+                bounds = [pd.Timestamp(v) if isinstance(v, str) else v for v in bounds]
+            except ValueError:
+                return None
+        if family == "compare":
+            return f"({c} {op_norm} {const(bounds[0])})"
+        return f"(({c} >= {const(bounds[0])}) & ({c} <= {const(bounds[1])}))"
+    if family == "set":
+        return f"({c} {'in' if op_norm in ('in', 'isin') else 'not in'} {const(val.values)})"
+    return None
+
+
+_MASK_BACKENDS: Dict[str, Callable[[pd.DataFrame, FilterNode, _Program, bool, frozenset], np.ndarray]] = {
+    "numpy": _numpy_mask,
+    "polars": _polars_mask,
+    "numba": _numba_mask,
+    "numexpr": _numexpr_mask,
+    "query": _query_mask,
+}
 
 
 # -----------------------------
@@ -1,8 +1,14 @@
+import re
 import sqlite3
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Callable, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib
@@ -31,11 +37,45 @@ THEME = {
     "btn_secondary_hover": "#2a3a5f",
     "btn_secondary_active": "#334a7a",
 }
+PALETTE = tuple(THEME["palette"])
 
 
 # ----------------------------
 # Rounded button (Canvas)
 # ----------------------------
+# Font objects per font spec, and (width, line height) per (font, text): buttons with the
+# same label (popup buttons, nav buttons) are measured once instead of via a throwaway Label.
+_FONT_CACHE: Dict[Any, tkfont.Font] = {}
+_TEXT_SIZE_CACHE: Dict[Tuple[Any, str], Tuple[int, int]] = {}
+
+
+def measure_text(font, text: str) -> Tuple[int, int]:
+    key = (font, text)
+    size = _TEXT_SIZE_CACHE.get(key)
+    if size is None:
+        f = _FONT_CACHE.get(font)
+        if f is None:
+            f = _FONT_CACHE[font] = tkfont.Font(font=font)
+        size = _TEXT_SIZE_CACHE[key] = (f.measure(text), f.metrics("linespace"))
+    return size
+
+
+# Border + padding (+ highlight) a default tk.Label adds on each side of its text, as (x, y).
+_LABEL_INSET: Optional[Tuple[int, int]] = None
+
+
+def label_inset(parent) -> Tuple[int, int]:
+    """Read once from a probe Label, so measured buttons keep the size the old Label measurement gave."""
+    global _LABEL_INSET
+    if _LABEL_INSET is None:
+        probe = tk.Label(parent)
+        px = probe.winfo_pixels
+        edge = px(probe.cget("borderwidth")) + px(probe.cget("highlightthickness"))
+        _LABEL_INSET = (edge + px(probe.cget("padx")), edge + px(probe.cget("pady")))
+        probe.destroy()
+    return _LABEL_INSET
+
+
 class RoundedButton(tk.Canvas):
     def __init__(
         self,
@@ -81,13 +121,15 @@ class RoundedButton(tk.Canvas):
         self.font = font
         self._state_bg = bg
         self._pressed = False
+        self._has_focus = False
+        # Canvas items, created by the first _draw
+        self._rect_id = self._text_id = self._focus_id = None
 
         # Measure text -> size
-        tmp = tk.Label(parent, text=text, font=font)
-        tmp.update_idletasks()
-        w = (tmp.winfo_reqwidth() + self.padx * 2) if width is None else width
-        h = tmp.winfo_reqheight() + self.pady * 2
-        tmp.destroy()
+        text_w, text_h = measure_text(font, text)
+        inset_x, inset_y = label_inset(parent)
+        w = (text_w + 2 * inset_x + self.padx * 2) if width is None else width
+        h = text_h + 2 * inset_y + self.pady * 2
 
         self.configure(width=w, height=h)
         self._draw()
@@ -96,14 +138,17 @@ class RoundedButton(tk.Canvas):
         self.bind("<Leave>", self._on_leave)
         self.bind("<ButtonPress-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
         self.bind("<space>", lambda e: self._invoke())
         self.bind("<Return>", lambda e: self._invoke())
 
         # allow focus via keyboard
         self.configure(takefocus=1)
 
-    def _rounded_rect(self, x1, y1, x2, y2, r, **kwargs):
-        points = [
+    @staticmethod
+    def _rounded_rect_points(x1, y1, x2, y2, r):
+        return [
             x1 + r, y1,
             x2 - r, y1,
             x2, y1,
@@ -117,46 +162,67 @@ class RoundedButton(tk.Canvas):
             x1, y1 + r,
             x1, y1,
         ]
-        return self.create_polygon(points, smooth=True, **kwargs)
 
     def _draw(self):
-        self.delete("all")
+        # The items are created on the first call; later calls only move/reconfigure them
+        # (coords/itemconfigure), and hover/press/release just recolor them (see _update).
         w = int(self["width"])
         h = int(self["height"])
+        rect = self._rounded_rect_points(2, 2, w - 2, h - 2, self.radius)
+        ring = self._rounded_rect_points(1, 1, w - 1, h - 1, self.radius)
+
+        if self._rect_id is None:
+            self._rect_id = self.create_polygon(rect, smooth=True, fill=self._state_bg, outline="")
+            self._text_id = self.create_text(w // 2, h // 2, text=self.text, fill=self.fg, font=self.font)
+            # Focus ring
+            self._focus_id = self.create_polygon(
+                ring, smooth=True, fill="", outline="#60a5fa", width=2, state="hidden"
+            )
+        else:
+            self.coords(self._rect_id, *rect)
+            self.coords(self._text_id, w // 2, h // 2)
+            self.itemconfigure(self._text_id, text=self.text, fill=self.fg, font=self.font)
+            self.coords(self._focus_id, *ring)
+        self._update()
 
-        self._rounded_rect(2, 2, w - 2, h - 2, self.radius, fill=self._state_bg, outline="")
-        self.create_text(w // 2, h // 2, text=self.text, fill=self.fg, font=self.font)
-
-        # Focus ring
-        if self.focus_displayof() == self:
-            self._rounded_rect(1, 1, w - 1, h - 1, self.radius, fill="", outline="#60a5fa", width=2)
+    def _update(self):
+        self.itemconfigure(self._rect_id, fill=self._state_bg)
+        self.itemconfigure(self._focus_id, state="normal" if self._has_focus else "hidden")
 
     def _invoke(self):
         if self.command:
             self.command()
 
+    def _on_focus_in(self, _e):
+        self._has_focus = True
+        self._update()
+
+    def _on_focus_out(self, _e):
+        self._has_focus = False
+        self._update()
+
     def _on_enter(self, _e):
         if not self._pressed:
             self._state_bg = self.hover_bg
-            self._draw()
+            self._update()
 
     def _on_leave(self, _e):
         self._pressed = False
         self._state_bg = self.bg0
-        self._draw()
+        self._update()
 
     def _on_press(self, _e):
         self._pressed = True
         self._state_bg = self.active_bg
         self.focus_set()
-        self._draw()
+        self._update()
 
     def _on_release(self, _e):
         if not self._pressed:
             return
         self._pressed = False
         self._state_bg = self.hover_bg
-        self._draw()
+        self._update()
         self._invoke()
 
 
@@ -179,10 +245,40 @@ def SecondaryButton(parent, text, command, **kwargs):
 # ----------------------------
 # DB helpers
 # ----------------------------
+# WAL lets readers run during writes and, with synchronous=NORMAL, commits stop fsyncing
+# the main database file; the rest keeps temp tables and hot pages in memory.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-20000",  # KiB, i.e. ~20 MB page cache
+    "mmap_size=268435456",
+    "busy_timeout=5000",
+)
+
+_CONN: Optional[sqlite3.Connection] = None
+
+
 def get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """The app's single tuned connection, opened on first use."""
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        _CONN = conn
+    return _CONN
+
+
+def close_conn():
+    global _CONN
+    if _CONN is not None:
+        # Refreshes planner statistics for the indexes when SQLite thinks they are stale.
+        _CONN.execute("PRAGMA optimize")
+        _CONN.close()
+        _CONN = None
+        _records_rows_cached.cache_clear()
 
 
 def init_db(conn):
@@ -198,7 +294,53 @@ def init_db(conn):
         );
         """
     )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_records_cat_month ON records(category, month)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_records_item ON records(item)")
     conn.commit()
+    init_fts(conn)
+
+
+# Full-text index over category/item for search_record_suggestions; kept in sync by triggers.
+_FTS_ENABLED = False
+
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE records_fts USING fts5(category, item, content='records', content_rowid='id')",
+    """
+    CREATE TRIGGER IF NOT EXISTS records_fts_ai AFTER INSERT ON records BEGIN
+        INSERT INTO records_fts(rowid, category, item) VALUES (new.id, new.category, new.item);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS records_fts_ad AFTER DELETE ON records BEGIN
+        INSERT INTO records_fts(records_fts, rowid, category, item) VALUES ('delete', old.id, old.category, old.item);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS records_fts_au AFTER UPDATE OF category, item ON records BEGIN
+        INSERT INTO records_fts(records_fts, rowid, category, item) VALUES ('delete', old.id, old.category, old.item);
+        INSERT INTO records_fts(rowid, category, item) VALUES (new.id, new.category, new.item);
+    END
+    """,
+)
+
+
+def init_fts(conn):
+    global _FTS_ENABLED
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='records_fts'"
+    ).fetchone()
+    try:
+        with conn:
+            if not exists:
+                for stmt in FTS_SCHEMA:
+                    conn.execute(stmt)
+                # Index rows that were inserted before the table existed.
+                conn.execute("INSERT INTO records_fts(records_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5: search falls back to LIKE scans.
+        _FTS_ENABLED = False
+        return
+    _FTS_ENABLED = True
 
 
 def seed_if_empty(conn):
@@ -206,40 +348,68 @@ def seed_if_empty(conn):
     if n:
         return
 
-    cats = ["North", "South", "East", "West"]
-    items = [f"Item {i}" for i in range(1, 7)]
-    base = {"North": 55, "South": 60, "East": 50, "West": 58}
+    cats = np.array(["North", "South", "East", "West"])
+    base = np.array([55, 60, 50, 58])
 
-    rows = []
-    for c in cats:
-        for m in range(1, 13):
-            for i, it in enumerate(items, start=1):
-                val = float(base[c] + (m - 6) * 1.1 + i * 2.5)
-                rows.append((c, m, it, val, 0))
+    # Every (category, month, item) combination, category-major like the nested loops it replaces.
+    C, M, I = np.meshgrid(np.arange(len(cats)), np.arange(1, 13), np.arange(1, 7), indexing="ij")
+    C, M, I = C.ravel(), M.ravel(), I.ravel()
+    vals = base[C] + (M - 6) * 1.1 + I * 2.5
+
+    rows = zip(cats[C].tolist(), M.tolist(), [f"Item {i}" for i in I.tolist()], vals.tolist(), repeat(0))
+    with conn:
+        conn.executemany(
+            "INSERT INTO records (category, month, item, value, accepted) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    # Give the planner real statistics for the new indexes.
+    conn.execute("ANALYZE")
+    bump_db_version()
+    invalidate_catalog_cache()
+
+
+# Dropdown options only change when records are written; writers call invalidate_catalog_cache().
+_CATALOG_CACHE: Dict[str, List[str]] = {}
+
+# Bumped by every write to records; query-result caches include it in their key.
+_DB_VERSION = 0
 
-    conn.executemany(
-        "INSERT INTO records (category, month, item, value, accepted) VALUES (?, ?, ?, ?, ?)",
-        rows,
-    )
-    conn.commit()
+
+def db_version() -> int:
+    return _DB_VERSION
+
+
+def bump_db_version():
+    global _DB_VERSION
+    _DB_VERSION += 1
+
+
+def invalidate_catalog_cache():
+    _CATALOG_CACHE.clear()
 
 
 def list_categories(conn):
-    return ["All"] + [
-        r["category"]
-        for r in conn.execute("SELECT DISTINCT category FROM records ORDER BY category").fetchall()
-    ]
+    cached = _CATALOG_CACHE.get("categories")
+    if cached is None:
+        cached = _CATALOG_CACHE["categories"] = ["All"] + [
+            r["category"]
+            for r in conn.execute("SELECT DISTINCT category FROM records ORDER BY category").fetchall()
+        ]
+    return list(cached)
 
 
 def list_months(conn):
-    months = [
-        int(r["month"])
-        for r in conn.execute("SELECT DISTINCT month FROM records ORDER BY month").fetchall()
-    ]
-    return ["All months"] + [str(m) for m in months]
+    cached = _CATALOG_CACHE.get("months")
+    if cached is None:
+        months = [
+            int(r["month"])
+            for r in conn.execute("SELECT DISTINCT month FROM records ORDER BY month").fetchall()
+        ]
+        cached = _CATALOG_CACHE["months"] = ["All months"] + [str(m) for m in months]
+    return list(cached)
 
 
-def df_records(conn, category: str, month_filter: str) -> pd.DataFrame:
+def _records_where(category: str, month_filter: str) -> Tuple[str, List[Any]]:
     clauses, params = [], []
     if category != "All":
         clauses.append("category = ?")
@@ -249,15 +419,119 @@ def df_records(conn, category: str, month_filter: str) -> pd.DataFrame:
         params.append(int(month_filter))
 
     where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
-    q = f"SELECT * FROM records {where}"
+    return where, params
+
+
+# Records loaded per page into the Review grid.
+REVIEW_PAGE_SIZE = 500
+# Display text for records.accepted, indexed by the stored flag (the table CHECK keeps it 0/1).
+_YES_NO = ("No", "Yes")
+
+# Column order of the raw record tuples handed to the pages.
+RECORD_COLUMNS = ("id", "category", "month", "item", "value", "accepted")
+
+
+def iter_records_rows(
+    conn, category: str, month_filter: str, limit: Optional[int] = None, offset: int = 0
+) -> Tuple[Tuple, ...]:
+    """Raw (id, category, month, item, value, accepted) tuples in id order, for pages that don't need a DataFrame."""
+    return _records_rows_cached(conn, category, month_filter, limit, offset, _DB_VERSION)
+
+
+@lru_cache(maxsize=32)
+def _records_rows_cached(
+    conn, category: str, month_filter: str, limit: Optional[int], offset: int, version: int
+) -> Tuple[Tuple, ...]:
+    where, params = _records_where(category, month_filter)
+    q = f"SELECT {', '.join(RECORD_COLUMNS)} FROM records {where} ORDER BY id"
+    if limit is not None or offset:
+        q += " LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]  # LIMIT -1: no upper bound
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(q, params)
+    return tuple(cur)
+
+
+def record_position(conn, record_id: int, category: str, month_filter: str = "All months") -> Optional[int]:
+    """1-based position of a record in id order within the filter, or None if the filter excludes it."""
+    where, params = _records_where(category, month_filter)
+    where += " AND " if where else "WHERE "
+    params.append(record_id)
+    if conn.execute(f"SELECT 1 FROM records {where}id = ? LIMIT 1", params).fetchone() is None:
+        return None
+    return conn.execute(f"SELECT COUNT(*) FROM records {where}id <= ?", params).fetchone()[0]
+
+
+# Analytics aggregates run in SQLite, so only the grouped rows reach pandas.
+def df_top_items(conn, category: str, month_filter: str, limit: int = 8) -> pd.DataFrame:
+    where, params = _records_where(category, month_filter)
+    q = f"""
+        SELECT item, AVG(value) AS avg_value, SUM(accepted) AS accepted, COUNT(*) AS total
+        FROM records {where}
+        GROUP BY item
+        ORDER BY avg_value DESC
+        LIMIT ?
+    """
+    return pd.read_sql_query(q, conn, params=params + [limit])
+
+
+def df_month_item_totals(conn, category: str, month_filter: str) -> pd.DataFrame:
+    """Value sums and row counts per (month, item); the charts roll these up by month and by item."""
+    where, params = _records_where(category, month_filter)
+    q = f"""
+        SELECT month, item, SUM(value) AS value_sum, COUNT(*) AS n
+        FROM records {where}
+        GROUP BY month, item
+    """
     return pd.read_sql_query(q, conn, params=params)
 
 
-def update_record(conn, record_id: int, field: str, value):
-    if field not in {"category", "month", "item", "value", "accepted"}:
-        raise ValueError("Invalid field")
-    conn.execute(f"UPDATE records SET {field}=? WHERE id=?", (value, record_id))
-    conn.commit()
+def df_accept_by_category(conn, category: str, month_filter: str) -> pd.DataFrame:
+    where, params = _records_where(category, month_filter)
+    q = f"""
+        SELECT category, SUM(accepted) AS accepted_cnt, COUNT(*) AS total_cnt
+        FROM records {where}
+        GROUP BY category
+        ORDER BY category
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(q, params).fetchall()
+    cats = [r[0] for r in rows]
+    accepted_cnt = np.array([r[1] for r in rows], dtype=np.int64)
+    total_cnt = np.array([r[2] for r in rows], dtype=np.int64)
+    # One row per category (COUNT(*) >= 1): the percentage is a single vectorized divide.
+    accepted_pct = np.round(100.0 * accepted_cnt / total_cnt, 1)
+    return pd.DataFrame(
+        {"category": cats, "accepted_cnt": accepted_cnt, "total_cnt": total_cnt, "accepted_pct": accepted_pct}
+    )
+
+
+# One fixed SQL text per editable field, so sqlite3's statement cache reuses the prepared plan.
+_UPDATE_STMTS: Dict[str, str] = {
+    f: f"UPDATE records SET {f}=? WHERE id=?" for f in ("category", "month", "item", "value", "accepted")
+}
+
+
+def update_accepted_many(conn, changes: List[Tuple[int, int]]):
+    """Apply (accepted, record_id) pairs in one transaction."""
+    if not changes:
+        return
+    with conn:
+        conn.executemany(_UPDATE_STMTS["accepted"], changes)
+    bump_db_version()
+
+
+def update_record_full(conn, record_id: int, category: str, month: int, item: str, value: float, accepted: int):
+    # One statement, one commit; a failing CHECK rolls the whole edit back.
+    with conn:
+        conn.execute(
+            "UPDATE records SET category=?, month=?, item=?, value=?, accepted=? WHERE id=?",
+            (category, month, item, value, accepted, record_id),
+        )
+    bump_db_version()
+    invalidate_catalog_cache()
 
 
 def search_record_suggestions(conn, term: str, limit: int = 50) -> List[str]:
@@ -265,13 +539,28 @@ def search_record_suggestions(conn, term: str, limit: int = 50) -> List[str]:
     if not term:
         return []
     is_num = term.isdigit()
+    rows: List[Any] = []
 
     if is_num:
         rows = conn.execute(
             "SELECT id, category, item, month FROM records WHERE id = ? ORDER BY id LIMIT ?",
             (int(term), limit),
         ).fetchall()
-    else:
+    elif _FTS_ENABLED and (tokens := re.findall(r"\w+", term)):
+        # Every word must prefix-match a word of category or item.
+        match = " ".join(f'"{t}"*' for t in tokens)
+        rows = conn.execute(
+            """
+            SELECT r.id, r.category, r.item, r.month
+            FROM records_fts f JOIN records r ON r.id = f.rowid
+            WHERE records_fts MATCH ?
+            ORDER BY r.id
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+    if not rows and not is_num:
+        # Substring match; also catches mid-word hits ("orth", "tem 3") that the word-prefix MATCH misses.
         like = f"%{term}%"
         rows = conn.execute(
             """
@@ -287,6 +576,14 @@ def search_record_suggestions(conn, term: str, limit: int = 50) -> List[str]:
     return [f"{r['id']} | {r['category']} | {r['item']} | m={r['month']}" for r in rows]
 
 
+def df_to_str_rows(df: pd.DataFrame, cols: Tuple[str, ...], fmt_map: Dict[str, str]) -> List[Tuple]:
+    """Treeview row tuples: columns in fmt_map are %-formatted column-wise in NumPy, the rest pass through."""
+    arrays = [
+        df[c].tolist() if c not in fmt_map else np.char.mod(fmt_map[c], df[c].to_numpy()).tolist() for c in cols
+    ]
+    return list(zip(*arrays))
+
+
 def parse_suggestion_to_id(s: str) -> Optional[int]:
     if not s:
         return None
@@ -344,21 +641,23 @@ def apply_ttk_style(root: tk.Tk):
 
 def apply_seaborn_theme():
     sns.set_theme(style="whitegrid")
-    sns.set_palette(THEME["palette"])
+    sns.set_palette(PALETTE)
 
 
 def style_matplotlib_axes(ax):
-    ax.set_facecolor(THEME["card"])
-    ax.figure.set_facecolor(THEME["card"])
-    ax.tick_params(colors=THEME["fg"])
+    card, fg, grid = THEME["card"], THEME["fg"], THEME["grid"]
+    ax.set_facecolor(card)
+    ax.figure.set_facecolor(card)
+    ax.tick_params(colors=fg)
     for spine in ax.spines.values():
         spine.set_color("#2a3a5f")
-    ax.title.set_color(THEME["fg"])
-    ax.xaxis.label.set_color(THEME["fg"])
-    ax.yaxis.label.set_color(THEME["fg"])
+    ax.title.set_color(fg)
+    ax.xaxis.label.set_color(fg)
+    ax.yaxis.label.set_color(fg)
     ax.grid(True, linestyle="--", alpha=0.25)
+    ax.set_axisbelow(True)
     for line in ax.get_xgridlines() + ax.get_ygridlines():
-        line.set_color(THEME["grid"])
+        line.set_color(grid)
 
 
 # ----------------------------
@@ -367,10 +666,27 @@ def style_matplotlib_axes(ax):
 FilterSpec = Dict[str, Any]
 
 
+def _stable_order(keys: np.ndarray, reverse: bool) -> np.ndarray:
+    """argsort matching sorted(..., reverse=reverse): equal keys keep their input order either way."""
+    if not reverse:
+        return np.argsort(keys, kind="stable")
+    n = len(keys)
+    return (n - 1 - np.argsort(keys[::-1], kind="stable"))[::-1]
+
+
 class TreeviewSortFilter:
-    def __init__(self, tree: ttk.Treeview, heading_labels: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        heading_labels: Optional[Dict[str, str]] = None,
+        load_rest: Optional[Callable[[], None]] = None,
+    ):
         self.tree = tree
+        # For paged data: fetches the rows not loaded yet, so sorts, filters and the filter
+        # popup's value list cover the whole data set rather than the loaded pages.
+        self.load_rest = load_rest
         self.columns = list(tree["columns"])
+        self._col_idx_map = {c: i for i, c in enumerate(self.columns)}
         if heading_labels is None:
             heading_labels = {c: tree.heading(c).get("text", c) for c in self.columns}
         self.base_heading = dict(heading_labels)
@@ -382,6 +698,15 @@ class TreeviewSortFilter:
         self._all_rows: List[Tuple] = []
         self._col_types: Dict[str, str] = {}
 
+        # Column-major views of _all_rows, rebuilt by set_data: str(value) per cell, numeric
+        # coercions (NaN where not a number) and sorted unique values, the latter two on demand.
+        self._str_cols: Dict[str, np.ndarray] = {c: np.array([], dtype=object) for c in self.columns}
+        self._num_cols: Dict[str, np.ndarray] = {}
+        self._uniq: Dict[str, List[str]] = {}
+        self._sort_keys: Dict[str, np.ndarray] = {}
+        # Treeview item per _all_rows entry (None until first shown); apply() reorders/detaches these.
+        self._row_iids: List[Optional[str]] = []
+
         tree.bind("<Button-1>", self._on_left_click, add=True)
         tree.bind("<Button-3>", self._on_right_click, add=True)
         tree.bind("<Button-2>", self._on_right_click, add=True)
@@ -394,60 +719,131 @@ class TreeviewSortFilter:
 
     def set_column_types(self, mapping: Dict[str, str]):
         self._col_types.update(mapping)
+        self._sort_keys = {}
 
     def set_data(self, rows: List[Tuple]):
+        # Keep the tree items of rows that are still present (matched by value), drop the rest.
+        pool: Dict[Tuple, List[str]] = {}
+        for r, iid in zip(self._all_rows, self._row_iids):
+            if iid is not None:
+                pool.setdefault(tuple(r), []).append(iid)
         self._all_rows = list(rows)
+        self._row_iids = [pool[r].pop() if pool.get(r) else None for r in map(tuple, self._all_rows)]
+        stale = [iid for iids in pool.values() for iid in iids]
+        # Recycle leftover items for new rows by rewriting their values; only the surplus is deleted.
+        for i, iid in enumerate(self._row_iids):
+            if not stale:
+                break
+            if iid is None:
+                iid = self._row_iids[i] = stale.pop()
+                self.tree.item(iid, values=self._all_rows[i])
+        if stale:
+            self.tree.delete(*stale)
+
+        self._str_cols = {
+            c: np.array([v if type(v) is str else str(v) for v in map(itemgetter(i), self._all_rows)], dtype=object)
+            for i, c in enumerate(self.columns)
+        }
+        self._num_cols = {}
+        self._uniq = {}
+        self._sort_keys = {}
         self.apply()
 
+    def add_rows(self, rows: List[Tuple]):
+        """Append rows (e.g. the next page) to the data set; items already in the tree are left alone."""
+        if not rows:
+            return
+        start = len(self._all_rows)
+        self._all_rows.extend(rows)
+        self._row_iids.extend(repeat(None, len(rows)))
+        self._str_cols = {
+            c: np.concatenate(
+                (self._str_cols[c], np.array([v if type(v) is str else str(v) for v in map(itemgetter(i), rows)], dtype=object))
+            )
+            for i, c in enumerate(self.columns)
+        }
+        self._num_cols = {}
+        self._uniq = {}
+        self._sort_keys = {}
+        if self.is_sorted_or_filtered():
+            self.apply()
+            return
+        # Unsorted and unfiltered: the new rows simply go at the end.
+        for i in range(start, len(self._all_rows)):
+            self._row_iids[i] = self.tree.insert("", "end", values=self._all_rows[i])
+
+    def is_sorted_or_filtered(self) -> bool:
+        return self._last_sort_col is not None or any(spec is not None for spec in self.filters.values())
+
+    def _num_col(self, col: str) -> np.ndarray:
+        arr = self._num_cols.get(col)
+        if arr is None:
+            idx = self._col_index(col)
+            coerced = (self._coerce_num(r[idx]) for r in self._all_rows)
+            arr = np.fromiter((np.nan if v is None else v for v in coerced), dtype=float, count=len(self._all_rows))
+            self._num_cols[col] = arr
+        return arr
+
+    def _sort_key_col(self, col: str) -> np.ndarray:
+        # Computed once per column per data set; re-sorting or flipping direction reuses it.
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            if self._col_types.get(col, "str") == "num":
+                keys = self._num_col(col)
+                keys = np.where(np.isnan(keys), np.inf, keys)  # non-numbers sort last
+            else:
+                keys = np.array([v.casefold() for v in self._str_cols[col].tolist()], dtype=object)
+            self._sort_keys[col] = keys
+        return keys
+
+    def _filter_mask(self, exclude: Optional[str] = None) -> Optional[np.ndarray]:
+        """Rows passing every active filter except `exclude`'s, or None when none apply."""
+        mask = None
+        for c, spec in self.filters.items():
+            if c == exclude or spec is None:
+                continue
+            if spec["mode"] == "set":
+                # Hash lookups: np.isin on object arrays compares every row with every allowed value.
+                allowed, vals = spec["allowed"], self._str_cols[c]
+                m = np.fromiter((v in allowed for v in vals.tolist()), dtype=bool, count=len(vals))
+            else:
+                v = self._num_col(c)
+                m = ~np.isnan(v)
+                if spec.get("min") is not None:
+                    m &= v >= spec["min"]
+                if spec.get("max") is not None:
+                    m &= v <= spec["max"]
+            mask = m if mask is None else (mask & m)
+        return mask
+
     def clear_all_filters(self):
         for c in self.columns:
             self.filters[c] = None
         self.apply()
 
     def apply(self):
-        rows = self._all_rows
-
-        for col, spec in self.filters.items():
-            if spec is None:
-                continue
-            idx = self._col_index(col)
-            if spec["mode"] == "set":
-                rows = [r for r in rows if str(r[idx]) in spec["allowed"]]
-            else:
-                mn = spec.get("min", None)
-                mx = spec.get("max", None)
-                out = []
-                for r in rows:
-                    v = self._coerce_num(r[idx])
-                    if v is None:
-                        continue
-                    if mn is not None and v < mn:
-                        continue
-                    if mx is not None and v > mx:
-                        continue
-                    out.append(r)
-                rows = out
+        # Filter and sort as index arrays over the column views; rows are materialized once at the end.
+        mask = self._filter_mask()
+        order = np.arange(len(self._all_rows)) if mask is None else np.flatnonzero(mask)
 
         if self._last_sort_col is not None:
             col = self._last_sort_col
             asc = self.sort_state.get(col, True)
-            idx = self._col_index(col)
-            if self._col_types.get(col, "str") == "num":
-                rows = sorted(
-                    rows,
-                    key=lambda r: self._coerce_num(r[idx]) if self._coerce_num(r[idx]) is not None else float("inf"),
-                    reverse=not asc,
-                )
-            else:
-                rows = sorted(rows, key=lambda r: str(r[idx]).lower(), reverse=not asc)
+            order = order[_stable_order(self._sort_key_col(col)[order], reverse=not asc)]
 
-        self.tree.delete(*self.tree.get_children())
-        for r in rows:
-            self.tree.insert("", "end", values=r)
+        # Create items only for rows never shown before, then reorder in one call; rows left
+        # out are detached (not deleted), so toggling a filter back is just another reorder.
+        iids = self._row_iids
+        for i in order.tolist():
+            if iids[i] is None:
+                iids[i] = self.tree.insert("", "end", values=self._all_rows[i])
+        self.tree.set_children("", *(iids[i] for i in order.tolist()))
 
         self._refresh_heading_texts()
 
     def toggle_sort(self, col: str):
+        if self.load_rest is not None:
+            self.load_rest()
         if self._last_sort_col == col:
             self.sort_state[col] = not self.sort_state.get(col, True)
         else:
@@ -480,6 +876,8 @@ class TreeviewSortFilter:
             return "break"
 
     def _open_filter_popup(self, col: str, x_root: int, y_root: int):
+        if self.load_rest is not None:
+            self.load_rest()
         popup = tk.Toplevel(self.tree)
         popup.title(f"Filter: {self.base_heading.get(col, col)}")
         popup.transient(self.tree.winfo_toplevel())
@@ -525,31 +923,13 @@ class TreeviewSortFilter:
         lb.grid(row=listbox_row_index, column=0, columnspan=3, sticky="nsew", pady=(8, 0))
 
         def unique_values_for_col() -> List[str]:
-            idx = self._col_index(col)
-            base_rows = self._all_rows
-
-            for c, spec in self.filters.items():
-                if c == col or spec is None:
-                    continue
-                j = self._col_index(c)
-                if spec["mode"] == "set":
-                    base_rows = [r for r in base_rows if str(r[j]) in spec["allowed"]]
-                else:
-                    mn = spec.get("min", None)
-                    mx = spec.get("max", None)
-                    tmp = []
-                    for r in base_rows:
-                        v = self._coerce_num(r[j])
-                        if v is None:
-                            continue
-                        if mn is not None and v < mn:
-                            continue
-                        if mx is not None and v > mx:
-                            continue
-                        tmp.append(r)
-                    base_rows = tmp
-
-            return sorted({str(r[idx]) for r in base_rows}, key=lambda v: v.lower())
+            # Values left after every *other* column's filter; unfiltered uniques are memoized per data set.
+            mask = self._filter_mask(exclude=col)
+            if mask is None:
+                if col not in self._uniq:
+                    self._uniq[col] = sorted(set(self._str_cols[col].tolist()), key=lambda v: v.lower())
+                return self._uniq[col]
+            return sorted(set(self._str_cols[col][mask].tolist()), key=lambda v: v.lower())
 
         all_vals = unique_values_for_col()
 
@@ -612,13 +992,16 @@ class TreeviewSortFilter:
         sort_col = self._last_sort_col
         sort_asc = self.sort_state.get(sort_col, True) if sort_col else True
 
+        base = self.base_heading
+        heading = self.tree.heading
+        sort_mark = "  ▲" if sort_asc else "  ▼"
         for c in self.columns:
-            label = self.base_heading.get(c, c)
+            label = base.get(c, c)
             if c in filtered_cols:
                 label += "  ⏷"
             if sort_col == c:
-                label += "  ▲" if sort_asc else "  ▼"
-            self.tree.heading(c, text=label)
+                label += sort_mark
+            heading(c, text=label)
 
     def _col_from_id(self, col_id: str) -> Optional[str]:
         try:
@@ -628,7 +1011,7 @@ class TreeviewSortFilter:
         return self.columns[i] if 0 <= i < len(self.columns) else None
 
     def _col_index(self, col: str) -> int:
-        return self.columns.index(col)
+        return self._col_idx_map[col]
 
     def _coerce_num(self, value: Any) -> Optional[float]:
         if value is None:
@@ -653,12 +1036,17 @@ class TreeviewSortFilter:
 # ----------------------------
 # Search slicer (shell row 0, only on Analytics)
 # ----------------------------
+SEARCH_DEBOUNCE_MS = 150  # keystrokes within this window coalesce into one query
+SEARCH_MIN_CHARS = 2  # shorter text terms would LIKE-scan for almost everything (ids are exempt)
+
+
 class RecordSearchSlicer(ttk.Frame):
     def __init__(self, parent, app):
         super().__init__(parent, style="Card.TFrame", padding=10)
         self.app = app
         self.term_var = tk.StringVar(value="")
         self.pick_var = tk.StringVar(value="")
+        self._pending: Optional[str] = None  # after() id of the scheduled suggestion query
 
         ttk.Label(self, text="Find record:", style="Card.TLabel").pack(side="left", padx=(0, 10))
 
@@ -670,13 +1058,33 @@ class RecordSearchSlicer(ttk.Frame):
 
         PrimaryButton(self, "Go", self.go_selected).pack(side="left")
 
-        self.term_var.trace_add("write", lambda *_: self._update_suggestions())
+        self.term_var.trace_add("write", lambda *_: self._schedule_update())
         self.combo.bind("<<ComboboxSelected>>", lambda e: self.go_selected())
-        self.entry.bind("<Return>", lambda e: self._update_suggestions(force_go_if_single=True))
+        self.entry.bind("<Return>", lambda e: self._search_now())
+
+    def _schedule_update(self):
+        self._cancel_pending()
+        self._pending = self.after(SEARCH_DEBOUNCE_MS, self._run_pending)
+
+    def _run_pending(self):
+        self._pending = None
+        self._update_suggestions()
+
+    def _cancel_pending(self):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+
+    def _search_now(self):
+        self._cancel_pending()
+        self._update_suggestions(force_go_if_single=True)
 
     def _update_suggestions(self, force_go_if_single: bool = False):
-        term = self.term_var.get()
-        opts = search_record_suggestions(self.app.conn, term, limit=50)
+        term = self.term_var.get().strip()
+        if len(term) < SEARCH_MIN_CHARS and not term.isdigit():
+            opts = []
+        else:
+            opts = search_record_suggestions(self.app.conn, term, limit=50)
         self.combo["values"] = opts
         if opts:
             self.pick_var.set(opts[0])
@@ -752,11 +1160,7 @@ class EditRecordDialog(tk.Toplevel):
             value = float(self.var_value.get().strip())
             accepted = 1 if self.var_accepted.get().strip().lower() in {"yes", "y", "1", "true"} else 0
 
-            update_record(self.app.conn, rid, "category", cat)
-            update_record(self.app.conn, rid, "month", month)
-            update_record(self.app.conn, rid, "item", item)
-            update_record(self.app.conn, rid, "value", value)
-            update_record(self.app.conn, rid, "accepted", accepted)
+            update_record_full(self.app.conn, rid, cat, month, item, value, accepted)
 
         except Exception as e:
             messagebox.showerror("Invalid edit", str(e), parent=self)
@@ -778,6 +1182,10 @@ class AnalyticsPage(ttk.Frame):
         self.category_var = tk.StringVar(value="All")
         self.month_var = tk.StringVar(value="All months")
         self._sortfilters: List[TreeviewSortFilter] = []
+        # (category, month, db version) of the last completed refresh; unchanged inputs skip the work.
+        self._last_key: Optional[Tuple[str, str, int]] = None
+        # (categories, months) the slicers currently list
+        self._slicer_options: Tuple[List[str], List[str]] = (app.category_options, app.month_options)
         self._build()
 
     def _build(self):
@@ -794,12 +1202,13 @@ class AnalyticsPage(ttk.Frame):
         slicers.grid(row=0, column=1, sticky="e", padx=(16, 0))
 
         ttk.Label(slicers, text="Category:", style="Muted.TLabel").grid(row=0, column=0, padx=(0, 6))
-        ttk.OptionMenu(
-            slicers, self.category_var, self.category_var.get(), *self.app.category_options, command=lambda _: self.refresh()
-        ).grid(row=0, column=1, padx=(0, 12))
+        self.category_menu = ttk.OptionMenu(
+            slicers, self.category_var, self.category_var.get(), *self._slicer_options[0], command=lambda _: self.refresh()
+        )
+        self.category_menu.grid(row=0, column=1, padx=(0, 12))
 
         ttk.Label(slicers, text="Month:", style="Muted.TLabel").grid(row=0, column=2, padx=(0, 6))
-        self.month_cb = ttk.Combobox(slicers, textvariable=self.month_var, values=self.app.month_options, state="readonly", width=12)
+        self.month_cb = ttk.Combobox(slicers, textvariable=self.month_var, values=self._slicer_options[1], state="readonly", width=12)
         self.month_cb.grid(row=0, column=3)
         self.month_cb.bind("<<ComboboxSelected>>", lambda e: self.refresh())
 
@@ -818,19 +1227,38 @@ class AnalyticsPage(ttk.Frame):
         charts_card.rowconfigure(1, weight=1)
         ttk.Label(charts_card, text="Charts", style="Card.TLabel").grid(row=0, column=0, sticky="w", pady=(0, 8))
 
-        self.fig = Figure(figsize=(10, 3.6), dpi=100)
+        # Low-density displays get fewer pixels to rasterize per draw.
+        dpi = 72 if float(self.tk.call("tk", "scaling")) < 1.3 else 100
+        self.fig = Figure(figsize=(10, 3.6), dpi=dpi)
         self.ax1 = self.fig.add_subplot(1, 2, 1)
         self.ax2 = self.fig.add_subplot(1, 2, 2)
         self.canvas = FigureCanvasTkAgg(self.fig, master=charts_card)
         self.canvas.get_tk_widget().grid(row=1, column=0, sticky="nsew")
 
+        # Axes decoration is set up once; refresh() only swaps the data of these artists.
+        self._line, = self.ax1.plot([], [], marker="o", color=PALETTE[0])
+        self.ax1.set_title("Trend (Avg Value by Month)")
+        self.ax1.set_xlabel("Month")
+        self.ax1.set_ylabel("Avg value")
+        self.ax1.set_xticks(list(range(1, 13)))
+        self._bars = self.ax2.bar([], [])
+        self._bar_items: List[str] = []
+        # Tick labels the current tight_layout was computed for
+        self._layout_ticks: Optional[Tuple] = None
+        self.ax2.set_title("Breakdown (Avg Value by Item)")
+        self.ax2.set_xlabel("Item")
+        self.ax2.set_ylabel("Avg value")
+        self.ax2.tick_params(axis="x", rotation=25)
+        style_matplotlib_axes(self.ax1)
+        style_matplotlib_axes(self.ax2)
+
         t1_card = ttk.Frame(main, style="Card.TFrame", padding=12)
         t1_card.grid(row=1, column=0, sticky="nsew", padx=(0, 6))
         t1_card.rowconfigure(1, weight=1)
         t1_card.columnconfigure(0, weight=1)
         ttk.Label(t1_card, text="Top Items", style="Card.TLabel").grid(row=0, column=0, sticky="w", pady=(0, 8))
 
-        self.t1_frame = self._make_table(
+        self.t1_frame, self.tree1 = self._make_table(
             t1_card,
             columns=("item", "avg_value", "accepted", "total"),
             headings={"item": "Item", "avg_value": "Avg", "accepted": "Accepted", "total": "Total"},
@@ -844,7 +1272,7 @@ class AnalyticsPage(ttk.Frame):
         t2_card.columnconfigure(0, weight=1)
         ttk.Label(t2_card, text="Acceptance by Category", style="Card.TLabel").grid(row=0, column=0, sticky="w", pady=(0, 8))
 
-        self.t2_frame = self._make_table(
+        self.t2_frame, self.tree2 = self._make_table(
             t2_card,
             columns=("category", "accepted_cnt", "total_cnt", "accepted_pct"),
             headings={"category": "Category", "accepted_cnt": "Accepted", "total_cnt": "Total", "accepted_pct": "%"},
@@ -871,57 +1299,76 @@ class AnalyticsPage(ttk.Frame):
         sf.set_column_types({c: ("num" if c in numeric_cols else "str") for c in columns})
         tree._sortfilter = sf
         self._sortfilters.append(sf)
-        return frame
+        return frame, tree
 
     def clear_all_filters(self):
         for sf in self._sortfilters:
             sf.clear_all_filters()
         self.app.set_status("Cleared table filters (Analytics)")
 
+    def _sync_slicers(self):
+        # The menus copy their option lists when built; pick up categories/months added since.
+        categories, months = self.app.category_options, self.app.month_options
+        if categories != self._slicer_options[0]:
+            self.category_menu.set_menu(self.category_var.get(), *categories)
+        if months != self._slicer_options[1]:
+            self.month_cb.configure(values=months)
+        self._slicer_options = (categories, months)
+
     def refresh(self):
+        self._sync_slicers()
         cat = self.category_var.get()
         month = self.month_var.get()
-        df = df_records(self.app.conn, cat, month)
-
-        self.ax1.clear()
-        self.ax2.clear()
-
-        line_df = df.groupby("month", as_index=False)["value"].mean().rename(columns={"value": "avg_value"})
-        sns.lineplot(data=line_df, x="month", y="avg_value", marker="o", ax=self.ax1)
-        self.ax1.set_title("Trend (Avg Value by Month)")
-        self.ax1.set_xlabel("Month")
-        self.ax1.set_ylabel("Avg value")
-        self.ax1.set_xticks(list(range(1, 13)))
-
-        bar_df = df.groupby("item", as_index=False)["value"].mean().rename(columns={"value": "avg_value"})
-        sns.barplot(data=bar_df, x="item", y="avg_value", ax=self.ax2)
-        self.ax2.set_title("Breakdown (Avg Value by Item)")
-        self.ax2.set_xlabel("Item")
-        self.ax2.set_ylabel("Avg value")
-        self.ax2.tick_params(axis="x", rotation=25)
-
-        style_matplotlib_axes(self.ax1)
-        style_matplotlib_axes(self.ax2)
-        self.fig.tight_layout()
-        self.canvas.draw()
-
-        top_items = (
-            df.groupby("item")
-            .agg(avg_value=("value", "mean"), accepted=("accepted", "sum"), total=("id", "count"))
-            .sort_values("avg_value", ascending=False)
-            .head(8)
-            .reset_index()
+        key = (cat, month, db_version())
+        if key == self._last_key:
+            return
+        # SQLite groups the records once by (month, item); both charts roll up those few rows.
+        by_cell = df_month_item_totals(self.app.conn, cat, month)
+        by_month = by_cell.groupby("month")[["value_sum", "n"]].sum()
+        by_item = by_cell.groupby("item")[["value_sum", "n"]].sum()
+
+        self._line.set_data(by_month.index.to_numpy(), (by_month["value_sum"] / by_month["n"]).to_numpy(dtype=float))
+        self.ax1.relim()
+        self.ax1.autoscale_view()
+
+        items = by_item.index.astype(str).tolist()
+        heights = (by_item["value_sum"] / by_item["n"]).to_numpy(dtype=float)
+        if items == self._bar_items:
+            # Same categories: only the bar heights move.
+            for bar, h in zip(self._bars, heights.tolist()):
+                bar.set_height(h)
+        else:
+            self._bars.remove()
+            pos = np.arange(len(items))
+            self._bars = self.ax2.bar(pos, heights, color=PALETTE[0])
+            self.ax2.set_xticks(pos, items)
+            self._bar_items = items
+        self.ax2.relim()
+        self.ax2.autoscale_view()
+
+        # Margins depend on the tick labels: the bar items follow the slicers and the y ticks follow
+        # the autoscaled ranges. tight_layout is slow, so it only reruns when those labels change.
+        ticks = (tuple(items), tuple(self.ax1.get_yticks()), tuple(self.ax2.get_yticks()))
+        if ticks != self._layout_ticks:
+            self.fig.tight_layout()
+            self._layout_ticks = ticks
+        self.canvas.draw_idle()
+
+        top_items = df_top_items(self.app.conn, cat, month)
+        t1_rows = df_to_str_rows(
+            top_items, ("item", "avg_value", "accepted", "total"), {"avg_value": "%.2f", "accepted": "%d", "total": "%d"}
         )
-        t1_rows = [(r.item, f"{r.avg_value:.2f}", str(int(r.accepted)), str(int(r.total))) for r in top_items.itertuples()]
-        tree1 = next(w for w in self.t1_frame.winfo_children() if isinstance(w, ttk.Treeview))
-        tree1._sortfilter.set_data(t1_rows)
+        self.tree1._sortfilter.set_data(t1_rows)
 
-        acc = df.groupby("category").agg(accepted_cnt=("accepted", "sum"), total_cnt=("id", "count")).reset_index()
-        acc["accepted_pct"] = (100.0 * acc["accepted_cnt"] / acc["total_cnt"]).round(1)
-        t2_rows = [(r.category, str(int(r.accepted_cnt)), str(int(r.total_cnt)), f"{r.accepted_pct:.1f}") for r in acc.itertuples()]
-        tree2 = next(w for w in self.t2_frame.winfo_children() if isinstance(w, ttk.Treeview))
-        tree2._sortfilter.set_data(t2_rows)
+        acc = df_accept_by_category(self.app.conn, cat, month)
+        t2_rows = df_to_str_rows(
+            acc,
+            ("category", "accepted_cnt", "total_cnt", "accepted_pct"),
+            {"accepted_cnt": "%d", "total_cnt": "%d", "accepted_pct": "%.1f"},
+        )
+        self.tree2._sortfilter.set_data(t2_rows)
 
+        self._last_key = key
         self.app.set_status(f"Analytics updated — Category={cat}, Month={month}")
 
 
@@ -932,6 +1379,11 @@ class ReviewEditPage(ttk.Frame):
         self.category_var = tk.StringVar(value="All")
         self.columns = ("id", "category", "month", "item", "value", "accepted")
         self.sf: Optional[TreeviewSortFilter] = None
+        # The grid holds the first _limit records (id order); later pages are appended on demand.
+        self._limit = REVIEW_PAGE_SIZE
+        self._has_more = False
+        self._load_pending = False  # a scroll-triggered load_more is already scheduled
+        self._menu_categories: List[str] = app.category_options  # categories the menu currently lists
         self._build()
 
     def _build(self):
@@ -948,13 +1400,15 @@ class ReviewEditPage(ttk.Frame):
         controls.grid(row=0, column=1, sticky="e", padx=(16, 0))
 
         ttk.Label(controls, text="Category:", style="Muted.TLabel").grid(row=0, column=0, padx=(0, 6))
-        ttk.OptionMenu(controls, self.category_var, self.category_var.get(), *self.app.category_options, command=lambda _: self.refresh()).grid(
-            row=0, column=1, padx=(0, 12)
+        self.category_menu = ttk.OptionMenu(
+            controls, self.category_var, self.category_var.get(), *self._menu_categories, command=self._on_category
         )
+        self.category_menu.grid(row=0, column=1, padx=(0, 12))
 
         SecondaryButton(controls, "Refresh", self.refresh).grid(row=0, column=2, padx=(0, 8))
         PrimaryButton(controls, "Edit selected", self.edit_selected).grid(row=0, column=3, padx=(0, 8))
-        SecondaryButton(controls, "Toggle Accept", self.toggle_accept).grid(row=0, column=4)
+        SecondaryButton(controls, "Toggle Accept", self.toggle_accept).grid(row=0, column=4, padx=(0, 8))
+        SecondaryButton(controls, "Load more", self.load_more).grid(row=0, column=5)
 
         SecondaryButton(header, "Clear table filters", self.clear_all_filters).grid(row=0, column=2, sticky="e")
 
@@ -986,7 +1440,15 @@ class ReviewEditPage(ttk.Frame):
 
         vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        def on_yscroll(first, last):
+            vsb.set(first, last)
+            # Scrolled to the bottom of a list that scrolls at all: fetch the next page.
+            if self._has_more and not self._load_pending and float(first) > 0.0 and float(last) >= 1.0:
+                self._load_pending = True
+                self.after_idle(self.load_more)
+
+        self.tree.configure(yscrollcommand=on_yscroll, xscrollcommand=hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -994,7 +1456,7 @@ class ReviewEditPage(ttk.Frame):
 
         self.tree.bind("<Double-1>", lambda e: self.edit_selected())
 
-        self.sf = TreeviewSortFilter(self.tree, heading_labels=headings)
+        self.sf = TreeviewSortFilter(self.tree, heading_labels=headings, load_rest=self.load_rest)
         self.sf.set_column_types({"id": "num", "month": "num", "value": "num"})
 
     def clear_all_filters(self):
@@ -1003,14 +1465,58 @@ class ReviewEditPage(ttk.Frame):
             self.app.set_status("Cleared table filters (Review/Edit)")
 
     def refresh(self):
-        df = df_records(self.app.conn, self.category_var.get(), "All months")
-        rows = []
-        for r in df.itertuples(index=False):
-            accepted = "Yes" if int(r.accepted) == 1 else "No"
-            rows.append((r.id, r.category, r.month, r.item, f"{r.value:.2f}", accepted))
+        categories = self.app.category_options
+        if categories != self._menu_categories:
+            # The menu copies its options when built; pick up categories added since.
+            self.category_menu.set_menu(self.category_var.get(), *categories)
+            self._menu_categories = categories
+        # Straight from the cursor rows: the grid only needs display strings, not a DataFrame.
+        # One extra row tells whether another page exists.
         assert self.sf is not None
+        # A sorted/filtered grid needs every record, not just the pages loaded so far.
+        rows = self._fetch_rows(0, None if self.sf.is_sorted_or_filtered() else self._limit)
         self.sf.set_data(rows)
-        self.app.set_status("Review grid updated")
+        self._limit = max(self._limit, len(rows))
+        self._report(len(rows))
+
+    def _fetch_rows(self, offset: int, limit: Optional[int]) -> List[Tuple]:
+        """Display rows for up to `limit` records after the first `offset`; also updates _has_more."""
+        # One extra row tells whether another page exists.
+        records = iter_records_rows(
+            self.app.conn, self.category_var.get(), "All months", limit=None if limit is None else limit + 1, offset=offset
+        )
+        self._has_more = limit is not None and len(records) > limit
+        return [
+            (rid, cat, month, item, f"{value:.2f}", _YES_NO[accepted])
+            for rid, cat, month, item, value, accepted in records[:limit]
+        ]
+
+    def _report(self, n_loaded: int):
+        if self._has_more:
+            self.app.set_status(f"Review grid updated (first {n_loaded} records, more available)")
+        else:
+            self.app.set_status("Review grid updated")
+
+    def _on_category(self, _value):
+        self._limit = REVIEW_PAGE_SIZE
+        self.refresh()
+
+    def load_more(self):
+        self._load_pending = False
+        self._append(REVIEW_PAGE_SIZE)
+
+    def load_rest(self):
+        self._append(None)
+
+    def _append(self, limit: Optional[int]):
+        # Only the records after the loaded ones are queried; the grid keeps what it has.
+        if not self._has_more:
+            return
+        rows = self._fetch_rows(self._limit, limit)
+        assert self.sf is not None
+        self.sf.add_rows(rows)
+        self._limit += len(rows)
+        self._report(self._limit)
 
     def selected_record_id(self) -> Optional[int]:
         sel = self.tree.selection()
@@ -1046,11 +1552,11 @@ class ReviewEditPage(ttk.Frame):
         sel = self.tree.selection()
         if not sel:
             return
+        changes = []
         for iid in sel:
             vals = self.tree.item(iid, "values")
-            record_id = int(vals[0])
-            new_val = 0 if vals[5] == "Yes" else 1
-            update_record(self.app.conn, record_id, "accepted", new_val)
+            changes.append((0 if vals[5] == "Yes" else 1, int(vals[0])))
+        update_accepted_many(self.app.conn, changes)
 
         self.refresh()
         self.app.analytics_page.refresh()
@@ -1067,6 +1573,10 @@ class ReviewEditPage(ttk.Frame):
 
         if self.sf:
             self.sf.clear_all_filters()
+        # Grow the loaded prefix to the page that holds the record, if the category includes it.
+        pos = record_position(self.app.conn, record_id, self.category_var.get())
+        if pos is not None and pos > self._limit:
+            self._limit = -(-pos // REVIEW_PAGE_SIZE) * REVIEW_PAGE_SIZE
         self.refresh()
 
         for iid in self.tree.get_children():
@@ -1097,9 +1607,6 @@ class App(tk.Tk):
         init_db(self.conn)
         seed_if_empty(self.conn)
 
-        self.category_options = list_categories(self.conn)
-        self.month_options = list_months(self.conn)
-
         # root grid
         self.rowconfigure(0, weight=1)
         self.columnconfigure(0, weight=1)
@@ -1151,6 +1658,15 @@ class App(tk.Tk):
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    # Read through the catalog cache: no query unless a write changed categories/months since.
+    @property
+    def category_options(self) -> List[str]:
+        return list_categories(self.conn)
+
+    @property
+    def month_options(self) -> List[str]:
+        return list_months(self.conn)
+
     def show(self, name: str):
         if name == "analytics":
             self.search_slicer.grid()  # show
@@ -1166,7 +1682,7 @@ class App(tk.Tk):
 
     def on_close(self):
         try:
-            self.conn.close()
+            close_conn()
         except Exception:
             pass
         self.destroy()
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_utils
+from data_utils import filter_df_nested
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = data_utils._POLARS_MIN_ROWS + 500
+    return pd.DataFrame({
+        "Int": pd.array(np.where(rng.random(n) < 0.2, None, rng.integers(0, 10, n)), dtype="Int64"),
+        "F64": pd.array(np.where(rng.random(n) < 0.2, None, rng.normal(size=n)), dtype="Float64"),
+        "fn": np.where(rng.random(n) < 0.2, np.nan, rng.normal(size=n)),
+        "f32": rng.integers(0, 5, n).astype("float32"),
+        "i8": rng.integers(0, 5, n).astype("int8"),
+        "u64": rng.integers(0, 5, n).astype("uint64"),
+        "flag": rng.random(n) < 0.5,
+        "name": pd.Series(rng.choice(["Ann", "bob", None], n), dtype=object),
+        "s": pd.array(rng.choice(["ab", "Cd", None], n), dtype="string"),
+    })
+
+
+FILTERS = [
+    {"col": "Int", "op": "!=", "value": 3},
+    {"col": "Int", "op": ">", "value": 5},
+    {"col": "Int", "op": "between", "value": [2, 6]},
+    {"col": "Int", "op": "in", "value": [1, 2.5, 3]},
+    {"col": "F64", "op": "<", "value": 0},
+    {"col": "fn", "op": "!=", "value": 0.5},
+    {"col": "fn", "op": "in", "value": [1, 2, 3]},
+    {"col": "f32", "op": "in", "value": [1, 2, 3]},
+    {"col": "i8", "op": "in", "value": [1, 2.5]},
+    {"col": "u64", "op": "not_in", "value": [0, 4]},
+    {"col": "flag", "op": "in", "value": [True]},
+    {"col": "name", "op": "==", "value": "ann"},
+    {"col": "name", "op": "!=", "value": "BOB"},
+    {"col": "s", "op": "==", "value": "ab"},
+]
+
+
+@pytest.mark.parametrize("case_insensitive", [False, True])
+@pytest.mark.parametrize("node", FILTERS + [{"not": f} for f in FILTERS], ids=repr)
+def test_polars_backend_matches_numpy_with_missing_values(frame, node, case_insensitive):
+    expected = filter_df_nested(frame, node, case_insensitive=case_insensitive)
+    got = filter_df_nested(frame, node, case_insensitive=case_insensitive, backend="polars")
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_not_keeps_missing_values_excluded():
+    df = pd.DataFrame({"x": pd.array([1, None, 7, 3], dtype="Int64")})
+    for backend in ("numpy", "polars"):
+        out = filter_df_nested(df, {"not": {"col": "x", "op": ">", "value": 5}}, backend=backend)
+        assert out.index.tolist() == [0, 3]
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        {"col": "dt", "op": "endswith", "value": "01"},
+        {"col": "fn", "op": "contains", "value": "."},
+        {"col": "Int", "op": "startswith", "value": "1"},
+    ],
+    ids=repr,
+)
+def test_polars_backend_string_ops_on_non_string_columns(frame, node):
+    frame = frame.assign(dt=pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(len(frame)) % 60, unit="D"))
+    pd.testing.assert_frame_equal(filter_df_nested(frame, node, backend="polars"), filter_df_nested(frame, node))
+
+
+def test_polars_backend_falls_back_on_mixed_object_column(frame):
+    frame = frame.assign(mixed=pd.Series([1, "a", None, 2.5] * (len(frame) // 4), dtype=object))
+    node = {"col": "mixed", "op": "isnull"}
+    pd.testing.assert_frame_equal(filter_df_nested(frame, node, backend="polars"), filter_df_nested(frame, node))
+
+
+@pytest.mark.parametrize("missing", [None, np.nan])
+def test_isin_missing_value_same_alone_and_with_shared_column(missing):
+    df = pd.DataFrame({"o": pd.Series(["a", None, np.nan, "b"], dtype=object)})
+    leaf = {"col": "o", "op": "in", "value": [missing]}
+    expected = df[df["o"].isin([missing])].index.tolist()
+    assert filter_df_nested(df, leaf).index.tolist() == expected
+    # A second equality leaf on the column makes it share factorized codes.
+    node = {"or": [leaf, {"col": "o", "op": "==", "value": "b"}]}
+    assert filter_df_nested(df, node).index.tolist() == expected + [3]
+
+
+SORTED_VALUES = [-1, 0, 0.1, 0.2, 2, 2.5, 300, 1e20]
+
+
+@pytest.mark.parametrize("dtype", ["int8", "int64", "uint16", "float32", "float64"])
+def test_sorted_cols_match_scan(dtype):
+    rng = np.random.default_rng(1)
+    values = np.sort(np.concatenate([rng.integers(0, 5, 40), [0.1, 0.2, 0.3, 2.5]]).astype(dtype))
+    if values.dtype.kind == "f":
+        values = np.append(values, [np.nan, np.nan]).astype(dtype)  # NaN sorts last
+    df = pd.DataFrame({"x": values})
+    nodes = [{"col": "x", "op": op, "value": v} for op in ("==", "!=", "<", "<=", ">", ">=") for v in SORTED_VALUES]
+    nodes += [{"col": "x", "op": "between", "value": [lo, hi]} for lo in SORTED_VALUES for hi in SORTED_VALUES]
+    for node in nodes:
+        expected = filter_df_nested(df, node)
+        pd.testing.assert_frame_equal(filter_df_nested(df, node, sorted_cols={"x"}), expected, obj=repr(node))
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        {"col": "dt", "op": "==", "value": "2025-01-01"},
+        {"col": "dt", "op": "!=", "value": "2025-01-01"},
+        {"col": "dt", "op": ">=", "value": "2025-01-02"},
+        {"col": "dt", "op": "between", "value": ["2025-01-01", "2025-01-01"]},
+    ],
+    ids=repr,
+)
+def test_query_backend_parses_date_strings(monkeypatch, node):
+    pytest.importorskip("numexpr")
+    monkeypatch.setattr(data_utils, "_numexpr_pays_off", lambda n_rows: True)
+    df = pd.DataFrame({"dt": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"] * 4)})
+    pd.testing.assert_frame_equal(filter_df_nested(df, node, backend="query"), filter_df_nested(df, node))
+
+
+NUMERIC_FILTERS = [
+    {"col": "i8", "op": ">", "value": 2},
+    {"col": "i64", "op": "!=", "value": 30},
+    {"col": "u16", "op": "<=", "value": 100.5},
+    {"col": "f32", "op": "==", "value": 0.5},
+    {"col": "fn", "op": ">=", "value": 0},
+    {"col": "fn", "op": "isnull"},
+    {"col": "fn", "op": "between", "value": [-1, 1]},
+    {"col": "f32", "op": "between", "value": [0.1, 0.7]},
+    {"col": "i64", "op": "in", "value": [1, 2, 3]},
+    {"col": "i8", "op": "not_in", "value": [0, 4.5]},
+    {"col": "i64", "op": "in", "value": list(range(0, 100_000, 37))},  # long enough for the Bloom prefilter
+    {"col": "flag", "op": "==", "value": True},
+]
+NUMERIC_TREES = NUMERIC_FILTERS + [
+    {"and": [NUMERIC_FILTERS[0], NUMERIC_FILTERS[4], NUMERIC_FILTERS[8]]},
+    {"or": [NUMERIC_FILTERS[1], {"not": NUMERIC_FILTERS[6]}]},
+    {"not": [NUMERIC_FILTERS[2], {"or": [NUMERIC_FILTERS[3], NUMERIC_FILTERS[5]]}]},
+]
+
+
+@pytest.fixture
+def numeric_frame():
+    rng = np.random.default_rng(2)
+    n = 5000
+    return pd.DataFrame({
+        "i8": rng.integers(-5, 5, n).astype("int8"),
+        "i64": rng.integers(0, 100_000, n),
+        "u16": rng.integers(0, 200, n).astype("uint16"),
+        "f32": (rng.integers(0, 10, n) / 10).astype("float32"),
+        "fn": np.where(rng.random(n) < 0.1, np.nan, rng.normal(size=n)),
+        "flag": rng.random(n) < 0.5,
+    }, index=rng.permutation(n))
+
+
+@pytest.fixture
+def forced_backends(monkeypatch):
+    """Run the optional backends at any size, and fail if one falls back to the numpy path."""
+    monkeypatch.setattr(data_utils, "_POLARS_MIN_ROWS", 0)
+    monkeypatch.setattr(data_utils, "_NUMBA_MIN_ROWS", 0)
+    monkeypatch.setattr(data_utils, "_numexpr_pays_off", lambda n_rows: True)
+
+    def no_fallback(*args):
+        raise AssertionError("backend fell back to numpy")
+
+    monkeypatch.setattr(data_utils, "_numpy_mask", no_fallback)
+
+
+@pytest.mark.parametrize("backend", ["numexpr", "query", "numba", "polars"])
+@pytest.mark.parametrize("node", NUMERIC_TREES, ids=repr)
+def test_backend_matches_numpy(numeric_frame, forced_backends, backend, node):
+    if backend in ("numexpr", "query"):
+        pytest.importorskip("numexpr")
+    else:
+        pytest.importorskip(backend)
+    if backend in ("numexpr", "numba") and node is NUMERIC_FILTERS[10]:
+        pytest.skip("long in-lists are not fused")
+    expected = filter_df_nested(numeric_frame, node)
+    pd.testing.assert_frame_equal(filter_df_nested(numeric_frame, node, backend=backend), expected)
+
+
+def test_bloom_prefiltered_isin_matches_pandas(numeric_frame):
+    values = list(range(0, 100_000, 37))
+    assert len(values) > data_utils._BLOOM_MIN_VALUES
+    for op, keep in (("in", True), ("not_in", False)):
+        got = filter_df_nested(numeric_frame, {"col": "i64", "op": op, "value": values})
+        expected = numeric_frame[numeric_frame["i64"].isin(values) == keep]
+        pd.testing.assert_frame_equal(got, expected)
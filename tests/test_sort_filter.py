@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+pytest.importorskip("tkinter")
+# test_app selects the TkAgg backend on import, which needs a display.
+test_app = pytest.importorskip("test_app", exc_type=ImportError)
+
+
+class FakeTree:
+    """Just enough of ttk.Treeview for TreeviewSortFilter, without a display."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.values = {}
+        self.order = []
+
+    def __getitem__(self, key):
+        return self.columns
+
+    def heading(self, col, **kwargs):
+        return {"text": col}
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def insert(self, parent, index, values=()):
+        iid = f"I{len(self.values)}"
+        self.values[iid] = tuple(values)
+        self.order.append(iid)
+        return iid
+
+    def item(self, iid, option=None, **kwargs):
+        if "values" in kwargs:
+            self.values[iid] = tuple(kwargs["values"])
+            return None
+        return self.values[iid]
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.values.pop(iid)
+            if iid in self.order:
+                self.order.remove(iid)
+
+    def set_children(self, parent, *iids):
+        self.order = list(iids)
+
+    def shown(self):
+        return [self.values[iid] for iid in self.order]
+
+
+def make_sort_filter(rows):
+    sf = test_app.TreeviewSortFilter(FakeTree(["id", "name"]))
+    sf.set_column_types({"id": "num"})
+    sf.set_data(rows)
+    return sf
+
+
+def test_set_filter_with_large_allowed_set():
+    rows = [(i, f"name {i % 7}") for i in range(10_000)]
+    sf = make_sort_filter(rows)
+    # "Select all" in the popup followed by unticking one id.
+    sf.filters["id"] = {"mode": "set", "allowed": {str(i) for i in range(10_000) if i != 1234}}
+
+    start = time.perf_counter()
+    sf.apply()
+    elapsed = time.perf_counter() - start
+
+    shown = sf.tree.shown()
+    assert len(shown) == 9_999
+    assert (1234, "name 2") not in shown
+    assert elapsed < 0.5
+
+
+def test_filter_mask_excludes_column_for_popup_values():
+    rows = [(i, f"name {i % 3}") for i in range(9)]
+    sf = make_sort_filter(rows)
+    sf.filters["id"] = {"mode": "set", "allowed": {"0", "1", "2"}}
+    sf.filters["name"] = {"mode": "set", "allowed": {"name 1"}}
+    # The popup for "name" lists values left by every other column's filter.
+    mask = sf._filter_mask(exclude="name")
+    assert mask.tolist() == [True, True, True] + [False] * 6
+    assert sf._filter_mask().tolist() == [False, True] + [False] * 7
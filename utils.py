@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
 import datetime as dt
 import re
 
@@ -9,6 +9,9 @@ import pandas as pd
 
 
 _EXCEL_DATE_BASE_1900 = dt.datetime(1899, 12, 30)  # pandas convention for Excel serials
+_NUM_RE = re.compile(r"[-+]?\d+(\.\d+)?")  # numeric-looking strings accepted as serials
+_TRUE_STRINGS = np.array(["true", "t", "yes", "y", "1"], dtype=object)
+_FALSE_STRINGS = np.array(["false", "f", "no", "n", "0"], dtype=object)
 
 
 def _parse_excel_serial_date(val: Any, *, tz: Optional[str] = None):
@@ -26,7 +29,7 @@ def _parse_excel_serial_date(val: Any, *, tz: Optional[str] = None):
         if s == "":
             return pd.NaT
         # Accept numeric-ish strings
-        if re.fullmatch(r"[-+]?\d+(\.\d+)?", s):
+        if _NUM_RE.fullmatch(s):
             try:
                 val = float(s)
             except Exception:
@@ -54,20 +57,38 @@ def _parse_excel_serial_date(val: Any, *, tz: Optional[str] = None):
     return ts
 
 
+def _excel_serial_series(s: pd.Series) -> pd.Series:
+    """
+    Vectorized `_parse_excel_serial_date` (without tz) over a whole Series.
+    Numbers and numeric-looking strings in the serial range become Timestamps, everything else NaT.
+    """
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        # Already numbers (incl. bool / nullable): no parsing needed.
+        num = pd.Series(s.to_numpy(dtype="float64", na_value=np.nan), index=s.index)
+    else:
+        num = pd.Series(pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan), index=s.index)
+        # Strings (object or str/string dtype) must look like plain decimals ("47521", "-3.5");
+        # to_numeric alone would also take "1e5", "inf", ...
+        text = (s if pd.api.types.is_string_dtype(s.dtype) else s.astype("string")).str.strip()
+        num = num.where(text.isna() | text.str.fullmatch(_NUM_RE).fillna(False).astype(bool))
+    valid = (num >= 1) & (num <= 80000)
+    return pd.Timestamp(_EXCEL_DATE_BASE_1900) + pd.to_timedelta(num.where(valid), unit="D")
+
+
 def _to_date_series(s: pd.Series) -> pd.Series:
     """
     Convert a Series to python `datetime.date` objects (or NaT).
     Handles ISO strings, common date strings, pandas timestamps, AND Excel serials.
     """
     # 1) Try normal datetime parsing
-    dt_norm = pd.to_datetime(s, errors="coerce", infer_datetime_format=True)
+    dt_norm = pd.to_datetime(s, errors="coerce", cache=True)
 
     # 2) For values that didn't parse, try Excel serial conversion
     mask_bad = dt_norm.isna() & s.notna()
 
     if mask_bad.any():
-        # Apply serial conversion only to the problematic subset
-        converted = s.where(mask_bad).map(_parse_excel_serial_date)
+        # Serial conversion for the problematic subset
+        converted = _excel_serial_series(s.where(mask_bad))
         # Combine: prefer normal parse, else excel-serial parse
         dt_norm = dt_norm.where(~mask_bad, converted)
 
@@ -75,6 +96,60 @@ def _to_date_series(s: pd.Series) -> pd.Series:
     return dt_norm.dt.date
 
 
+def _to_datetime_series(s: pd.Series) -> pd.Series:
+    # For datetime, also support Excel serials when normal parse fails.
+    dt_norm = pd.to_datetime(s, errors="coerce", cache=True)
+    mask_bad = dt_norm.isna() & s.notna()
+    if mask_bad.any():
+        converted = _excel_serial_series(s.where(mask_bad))
+        dt_norm = dt_norm.where(~mask_bad, converted)
+    return dt_norm
+
+
+def _to_bool_series(s: pd.Series) -> pd.Series:
+    # Handle common representations
+    if s.dtype == "bool":
+        return s
+    # Anything outside the known spellings (incl. missing) becomes <NA>
+    lowered = s.astype("string").str.strip().str.lower().to_numpy(dtype=object, na_value="")
+    is_true = np.isin(lowered, _TRUE_STRINGS)
+    is_false = np.isin(lowered, _FALSE_STRINGS)
+    return pd.Series(pd.arrays.BooleanArray(is_true, ~(is_true | is_false)), index=s.index, name=s.name)
+
+
+def _to_int_series(s: pd.Series) -> pd.Series:
+    # Use pandas nullable integer so blanks don't blow up
+    return pd.to_numeric(s, errors="coerce").astype("Int64")
+
+
+def _to_float_series(s: pd.Series) -> pd.Series:
+    return pd.to_numeric(s, errors="coerce").astype("Float64")
+
+
+def _to_string_series(s: pd.Series) -> pd.Series:
+    return s.astype("string")
+
+
+# Normalized target tag -> converter; tags not listed here go to Series.astype(target).
+_COERCERS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "date": _to_date_series,
+    "datetime": _to_datetime_series,
+    "datetime64": _to_datetime_series,
+    "timestamp": _to_datetime_series,
+    "string": _to_string_series,
+    "str": _to_string_series,
+    "int": _to_int_series,
+    "int64": _to_int_series,
+    "integer": _to_int_series,
+    "float": _to_float_series,
+    "float64": _to_float_series,
+    "double": _to_float_series,
+    "bool": _to_bool_series,
+    "boolean": _to_bool_series,
+}
+_TYPE_TAGS = {int: "int", float: "float", bool: "bool", str: "string"}
+
+
 def coerce_dtypes(
     df: pd.DataFrame,
     dtype_map: Mapping[str, str | type],
@@ -94,7 +169,8 @@ def coerce_dtypes(
 
     Returns a NEW dataframe (does not mutate the original).
     """
-    out = df.copy()
+    # Shallow: assigning out[col] swaps in a new column, so untouched columns can share df's data.
+    out = df.copy(deep=False)
 
     for col, target in dtype_map.items():
         if col not in out.columns:
@@ -105,72 +181,11 @@ def coerce_dtypes(
         s = out[col]
 
         # Normalize target spec
-        t = target
-        if isinstance(t, type):
-            if t is int:
-                t = "int"
-            elif t is float:
-                t = "float"
-            elif t is bool:
-                t = "bool"
-            elif t is str:
-                t = "string"
-            else:
-                t = str(t)
-
-        if isinstance(t, str):
-            t_norm = t.strip().lower()
-        else:
-            t_norm = str(t).strip().lower()
-
-        if t_norm in {"date"}:
-            out[col] = _to_date_series(s)
-
-        elif t_norm in {"datetime", "datetime64", "timestamp"}:
-            # For datetime, also support Excel serials when normal parse fails.
-            dt_norm = pd.to_datetime(s, errors="coerce", infer_datetime_format=True)
-            mask_bad = dt_norm.isna() & s.notna()
-            if mask_bad.any():
-                converted = s.where(mask_bad).map(_parse_excel_serial_date)
-                dt_norm = dt_norm.where(~mask_bad, converted)
-            out[col] = dt_norm
-
-        elif t_norm in {"string", "str"}:
-            out[col] = s.astype("string")
-
-        elif t_norm in {"int", "int64", "integer"}:
-            # Use pandas nullable integer so blanks don't blow up
-            out[col] = pd.to_numeric(s, errors="coerce").astype("Int64")
-
-        elif t_norm in {"float", "float64", "double"}:
-            out[col] = pd.to_numeric(s, errors="coerce").astype("Float64")
-
-        elif t_norm in {"bool", "boolean"}:
-            # Handle common representations
-            if s.dtype == "bool":
-                out[col] = s
-            else:
-                mapped = (
-                    s.astype("string")
-                    .str.strip()
-                    .str.lower()
-                    .map(
-                        {
-                            "true": True,
-                            "t": True,
-                            "yes": True,
-                            "y": True,
-                            "1": True,
-                            "false": False,
-                            "f": False,
-                            "no": False,
-                            "n": False,
-                            "0": False,
-                        }
-                    )
-                )
-                out[col] = mapped.astype("boolean")
+        t = _TYPE_TAGS.get(target, target) if isinstance(target, type) else target
+        handler = _COERCERS.get(str(t).strip().lower())
 
+        if handler is not None:
+            out[col] = handler(s)
         else:
             # If user passed a pandas dtype like "Int64" / "category" / etc.
             try:
@@ -178,4 +193,4 @@ def coerce_dtypes(
             except Exception as e:
                 raise TypeError(f"Failed to coerce column '{col}' to {target!r}: {e}") from e
 
-    return out
\ No newline at end of file
+    return out